@@ -1,12 +1,32 @@
 import os
+import math
+import functools
 import random
 import json
+import logging
+import re
 import time
 import base64
+import io
+import hashlib
+import multiprocessing
+import threading
+import concurrent.futures
 from typing import List, Dict, Any, Optional, Tuple
-from PIL import Image, ImageDraw, ImageFont, ImageFilter  # type: ignore
-import requests
-from io import BytesIO
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageOps  # type: ignore
+
+# orjsonがあればGeminiのリクエスト/レスポンスのJSON処理に使う（無ければ標準のjson）
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+# libvipsがあればローカル画像の読み込み縮小に使う（無ければPillowのみで処理）
+try:
+    import pyvips  # type: ignore
+except (ImportError, OSError):
+    pyvips = None
 
 """
 テックガジェットスタイル（2chスレタイ風）サムネイル生成スクリプト。
@@ -18,12 +38,46 @@ from io import BytesIO
 - サブ/煽り字幕: 白文字・黒縁取り、斜め配置
 """
 
+# サムネイル1枚ごとに出る詳細ログ（配置座標・リサイズ結果等）はloggerのDEBUGレベルで出す。
+# 既定では抑制され、f文字列の整形もprintのI/Oも発生しない（失敗・フォールバックは従来通りprint）
+logger = logging.getLogger(__name__)
+
 THUMBNAIL_WIDTH = 1280
 THUMBNAIL_HEIGHT = 720
 TOP_AREA_HEIGHT = int(THUMBNAIL_HEIGHT * 0.7)  # 上部70%
 BOTTOM_AREA_HEIGHT = THUMBNAIL_HEIGHT - TOP_AREA_HEIGHT  # 下部30%
+BOTTOM_AREA_COLOR = (255, 220, 0)  # 鮮やかな黄色
+YOUTUBE_THUMBNAIL_MAX_BYTES = 2 * 1024 * 1024  # YouTubeサムネイルのアップロード上限
+# PNG保存時のzlib圧縮レベル（1=高速・やや大きい、6=Pillow既定、9=最小）。上限超過時は9で保存し直す
+THUMBNAIL_PNG_COMPRESS_LEVEL = min(9, max(0, int(os.environ.get("THUMBNAIL_PNG_COMPRESS_LEVEL", "1"))))
+
+# 素材画像の縮小に使うフィルタ（"lanczos" | "bicubic" | "bilinear"）
+# サムネイルサイズへの縮小では差がほぼ見えないため、既定は高速なBILINEAR
+_RESAMPLE_FILTERS = {
+    "lanczos": Image.Resampling.LANCZOS,
+    "bicubic": Image.Resampling.BICUBIC,
+    "bilinear": Image.Resampling.BILINEAR,
+}
+THUMBNAIL_RESAMPLE = _RESAMPLE_FILTERS.get(
+    os.environ.get("THUMBNAIL_RESAMPLE", "bilinear").lower(),
+    Image.Resampling.BILINEAR,
+)
+
+
+def _build_base_canvas() -> Image.Image:
+    """白背景＋下部30%の黄色背景（座布団）を描いたベースキャンバスを作成"""
+    # 単色の矩形2つなので、配列のスライス代入で連続領域を一括で埋める
+    arr = np.full((THUMBNAIL_HEIGHT, THUMBNAIL_WIDTH, 3), 255, dtype=np.uint8)
+    arr[TOP_AREA_HEIGHT:, :] = BOTTOM_AREA_COLOR
+    return Image.fromarray(arr)
+
+
+# 全サムネイル共通なのでモジュール読み込み時に一度だけ描画し、各回は copy() する
+_BASE_CANVAS = _build_base_canvas()
 
 # クロスプラットフォーム対応のフォント検出
+# プロセス内でフォントの配置は変わらないため、探索結果はキャッシュしてstatを繰り返さない
+@functools.lru_cache(maxsize=1)
 def find_japanese_font() -> str:
     """日本語対応フォントをクロスプラットフォームで検出"""
     possible_fonts = [
@@ -55,6 +109,7 @@ def find_japanese_font() -> str:
 # けいふぉんとを優先
 KEIFONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "keifont.ttf")
 
+@functools.lru_cache(maxsize=4)
 def resolve_thumbnail_font(env_key: str) -> str:
     env_font = os.environ.get(env_key, "")
     if env_font and os.path.exists(env_font):
@@ -69,6 +124,41 @@ def resolve_thumbnail_font(env_key: str) -> str:
 FONT_PATH_MAIN = resolve_thumbnail_font("THUMBNAIL_FONT_MAIN")
 FONT_PATH_SUB = resolve_thumbnail_font("THUMBNAIL_FONT_SUB")
 
+
+@functools.lru_cache(maxsize=1)
+def detect_pillow_simd() -> bool:
+    """
+    Pillow-SIMD（SSE4/AVX2）が有効かを判定してloggerに1回だけ出力する。
+    resize/rotate/paste はコード変更なしでSIMDカーネルに切り替わるため、確認だけ行う。
+    import時には実行しない（バッチのワーカープロセスごとに出力されるのを避ける）。
+    """
+    import PIL
+
+    pil_version = getattr(PIL, "__version__", "unknown")
+    is_simd_build = ".post" in pil_version  # Pillow-SIMDは "x.y.z.postN" 形式
+
+    cpu_flags = set()
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    cpu_flags.update(line.split(":", 1)[1].split())
+                    break
+    except OSError:
+        pass  # macOS/Windows等では/proc/cpuinfoが無い
+
+    simd_features = [flag for flag in ("sse4_1", "sse4_2", "avx2") if flag in cpu_flags]
+    if is_simd_build:
+        logger.info("Pillow-SIMD %s detected (cpu: %s)", pil_version, ", ".join(simd_features) or "unknown")
+    elif simd_features:
+        logger.info(
+            "Stock Pillow %s on SIMD-capable CPU (%s); install pillow-simd for faster resize/rotate",
+            pil_version, ", ".join(simd_features),
+        )
+    else:
+        logger.info("Stock Pillow %s (no SSE4/AVX2 detected)", pil_version)
+    return is_simd_build
+
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 GEMINI_MODEL_NAME = os.environ.get("GEMINI_MODEL_NAME", "gemini-2.5-flash-lite")
 def resolve_gemini_api_version(model_name: str, configured_version: Optional[str]) -> str:
@@ -95,6 +185,42 @@ GEMINI_API_VERSION = resolve_gemini_api_version(
 THUMBNAIL_GEMINI_TEXT_FILTER = os.environ.get("THUMBNAIL_GEMINI_TEXT_FILTER", "1").lower() not in ("0", "false", "off")
 THUMBNAIL_GEMINI_MAX_CANDIDATES = max(2, int(os.environ.get("THUMBNAIL_GEMINI_MAX_CANDIDATES", "8")))
 THUMBNAIL_GEMINI_RANDOM_POOL = max(2, int(os.environ.get("THUMBNAIL_GEMINI_RANDOM_POOL", "4")))
+# Geminiへの同時リクエスト数（クォータが厳しい場合は下げる）
+THUMBNAIL_GEMINI_CONCURRENCY = max(1, int(os.environ.get("THUMBNAIL_GEMINI_CONCURRENCY", "8")))
+# Geminiに送る画像の長辺上限（文字量判定には十分な解像度。0で縮小しない）
+THUMBNAIL_GEMINI_MAX_EDGE = max(0, int(os.environ.get("THUMBNAIL_GEMINI_MAX_EDGE", "768")))
+# 実行をまたぐローカルキャッシュの有効化フラグ（render_video.py と同じ環境変数）
+# GitHub Actionsのランナーは毎回まっさらでキャッシュが当たらないため、永続ディスクのある環境でのみ有効にする
+PERSISTENT_CACHE = os.environ.get("PERSISTENT_CACHE", "0").lower() in ("1", "true", "on")
+
+
+# 画像ダウンロード・Gemini呼び出し共用のHTTPセッション（Keep-Aliveで接続を再利用しTLSハンドシェイクを省く）
+# requestsの読み込みは初回のHTTP通信まで遅らせる（描画ヘルパーだけ使う場合はimportしない）
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                # Retryのステータス再試行はGET等の冪等メソッドのみ対象。GeminiのPOSTは呼び出し側で再試行する
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=8,
+                        pool_maxsize=32,
+                        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 503)),
+                    ),
+                )
+                _SESSION = session
+    return _SESSION
 
 
 def _get_mime_type_from_path(image_path: str) -> Optional[str]:
@@ -112,25 +238,133 @@ def _get_mime_type_from_path(image_path: str) -> Optional[str]:
     return None
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _json_loads(data):
+    """str/bytesのJSONを読む（orjsonがあればbytesのままデコードせずに解析）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """JSONをUTF-8のbytesで返す（orjsonは直接bytesを出力する）"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Gemini文字量判定の永続キャッシュ（画像内容のsha256＋モデル名をキーに判定結果JSONを保存、PERSISTENT_CACHE 有効時のみ使用）
+# LOCAL_TEMP_DIR は毎回の実行後に削除されるため、実行をまたいで残る場所に置く
+THUMBNAIL_GEMINI_CACHE_DIR = os.environ.get(
+    "THUMBNAIL_GEMINI_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "proset", "gemini_text_density"),
+)
+THUMBNAIL_GEMINI_CACHE_MAX_FILES = max(1, int(os.environ.get("THUMBNAIL_GEMINI_CACHE_MAX_FILES", "1000")))
+
+
+def _gemini_cache_path(image_bytes: bytes) -> str:
+    digest = hashlib.sha256(image_bytes).hexdigest()
+    model_key = re.sub(r"[^A-Za-z0-9_.-]", "_", GEMINI_MODEL_NAME)
+    return os.path.join(THUMBNAIL_GEMINI_CACHE_DIR, f"{model_key}_{digest}.json")
+
+
+def _read_gemini_cache(cache_path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            result = _json_loads(f.read())
+        os.utime(cache_path)  # 削除順序（最近使った順）の更新
+        return result
+    except Exception as e:
+        print(f"[THUMBNAIL] Failed to read Gemini cache {cache_path}: {e}")
+        return None
+
+
+def _write_gemini_cache(cache_path: str, result: Dict[str, Any]) -> None:
+    """一時ファイルに書いてから置き換え、途中まで書かれたJSONを読まないようにする"""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps_bytes(result))
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[THUMBNAIL] Failed to write Gemini cache {cache_path}: {e}")
+        return
+    _prune_cache_dir(THUMBNAIL_GEMINI_CACHE_DIR, THUMBNAIL_GEMINI_CACHE_MAX_FILES, ".json")
+
+
+def _encode_image_for_gemini(image_bytes: bytes, mime_type: str) -> Tuple[str, str]:
+    """長辺が THUMBNAIL_GEMINI_MAX_EDGE を超える画像はJPEGに縮小してからbase64化する"""
+    if THUMBNAIL_GEMINI_MAX_EDGE:
+        try:
+            with Image.open(io.BytesIO(image_bytes)) as img:
+                if max(img.size) > THUMBNAIL_GEMINI_MAX_EDGE:
+                    edge = (THUMBNAIL_GEMINI_MAX_EDGE, THUMBNAIL_GEMINI_MAX_EDGE)
+                    img.draft("RGB", edge)
+                    small = img.convert("RGB")
+                    small.thumbnail(edge, Image.Resampling.BILINEAR)
+                    buf = io.BytesIO()
+                    small.save(buf, format="JPEG", quality=85)
+                    image_bytes = buf.getvalue()
+                    mime_type = "image/jpeg"
+        except Exception as e:
+            print(f"[THUMBNAIL] Gemini image downscale skipped: {e}")
+    return mime_type, base64.b64encode(image_bytes).decode("ascii")
+
+
+# 判定に成功した結果のみを保持するプロセス内メモ（キー: (画像パス, 更新時刻)）
+_GEMINI_RESULT_MEMO: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
 def _analyze_image_text_density_with_gemini(image_path: str) -> Optional[Dict[str, Any]]:
     if not THUMBNAIL_GEMINI_TEXT_FILTER:
         return None
     if not GEMINI_API_KEY:
         return None
-    if not os.path.exists(image_path):
+    try:
+        mtime = os.path.getmtime(image_path)
+    except OSError:
         return None
-
+    # 同一プロセス内（動画→サムネイル段階など）の再評価は (パス, 更新時刻) でメモ化
+    # 429/503や通信エラーによる None は一時的な失敗なので記録せず、次回に再判定する
+    memo_key = (image_path, mtime)
+    memoized = _GEMINI_RESULT_MEMO.get(memo_key)
+    if memoized is not None:
+        return memoized
+    result = _analyze_image_text_density_uncached(image_path)
+    if result is not None:
+        _GEMINI_RESULT_MEMO[memo_key] = result
+    return result
+
+
+def _analyze_image_text_density_uncached(image_path: str) -> Optional[Dict[str, Any]]:
     mime_type = _get_mime_type_from_path(image_path)
     if not mime_type:
         return None
 
     try:
         with open(image_path, "rb") as f:
-            image_b64 = base64.b64encode(f.read()).decode("utf-8")
+            image_bytes = f.read()
     except Exception as e:
         print(f"[THUMBNAIL] Failed to read image for Gemini text check: {image_path} ({e})")
         return None
 
+    # ディスクキャッシュは PERSISTENT_CACHE 有効時のみ（プロセス内メモは常に有効）
+    cache_path = _gemini_cache_path(image_bytes) if PERSISTENT_CACHE else None
+    if cache_path:
+        cached = _read_gemini_cache(cache_path)
+        if cached is not None:
+            print(f"[THUMBNAIL] Gemini text check cache hit: {os.path.basename(image_path)}")
+            return cached
+
+    # キャッシュキーは元画像のバイト列、送信するのは縮小版
+    mime_type, image_b64 = _encode_image_for_gemini(image_bytes, mime_type)
+    del image_bytes
+
     url = (
         f"https://generativelanguage.googleapis.com/{GEMINI_API_VERSION}/models/"
         f"{GEMINI_MODEL_NAME}:generateContent?key={GEMINI_API_KEY}"
@@ -156,11 +390,19 @@ def _analyze_image_text_density_with_gemini(image_path: str) -> Optional[Dict[st
             "response_mime_type": "application/json",
         },
     }
+    # 本文は一度だけシリアライズして再試行時も使い回す
+    body = _json_dumps_bytes(payload)
+    del payload, image_b64
 
     max_retries = 2
     for attempt in range(max_retries):
         try:
-            response = requests.post(url, json=payload, timeout=(5, 20))
+            response = _get_session().post(
+                url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=(5, 20),
+            )
             if response.status_code in (429, 503):
                 if attempt < max_retries - 1:
                     time.sleep(1.2)
@@ -170,7 +412,7 @@ def _analyze_image_text_density_with_gemini(image_path: str) -> Optional[Dict[st
                 print(f"[THUMBNAIL] Gemini text check failed: {response.status_code}")
                 return None
 
-            data = response.json()
+            data = _json_loads(response.content)
             candidates = data.get("candidates", [])
             if not candidates:
                 return None
@@ -180,23 +422,28 @@ def _analyze_image_text_density_with_gemini(image_path: str) -> Optional[Dict[st
                 return None
 
             try:
-                parsed = json.loads(raw_text)
+                parsed = _json_loads(raw_text)
             except Exception:
+                # 前後に説明文が付いた場合は最初の "{" から完結したJSONオブジェクト1つだけを読む
                 start = raw_text.find("{")
-                end = raw_text.rfind("}")
-                if start == -1 or end == -1 or end <= start:
+                if start == -1:
                     return None
-                parsed = json.loads(raw_text[start : end + 1])
+                parsed, _ = _JSON_DECODER.raw_decode(raw_text, start)
+            if not isinstance(parsed, dict):
+                return None
 
             text_ratio = int(parsed.get("text_ratio", 50))
             text_ratio = max(0, min(100, text_ratio))
             text_heavy = bool(parsed.get("text_heavy", text_ratio >= 35))
             keep = bool(parsed.get("keep", not text_heavy))
-            return {
+            result = {
                 "text_ratio": text_ratio,
                 "text_heavy": text_heavy,
                 "keep": keep,
             }
+            if cache_path:
+                _write_gemini_cache(cache_path, result)
+            return result
         except Exception as e:
             print(f"[THUMBNAIL] Gemini text check error: {e}")
             if attempt < max_retries - 1:
@@ -207,14 +454,32 @@ def _analyze_image_text_density_with_gemini(image_path: str) -> Optional[Dict[st
     return None
 
 
-def _select_thumbnail_image_paths(candidate_paths: List[str], count: int = 2) -> List[str]:
-    unique_paths: List[str] = []
-    seen = set()
-    for path in candidate_paths:
-        if not path or path in seen or not os.path.exists(path):
+def _existing_files(paths) -> set:
+    """
+    パスをディレクトリ毎にまとめ、os.scandir で1ディレクトリにつき1回の列挙で存在判定する。
+    存在する（通常ファイルの）パスの集合を返す。
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in paths:
+        if path:
+            by_dir.setdefault(os.path.dirname(path) or ".", []).append(path)
+
+    existing = set()
+    for dir_path, dir_paths in by_dir.items():
+        try:
+            with os.scandir(dir_path) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
             continue
-        seen.add(path)
-        unique_paths.append(path)
+        existing.update(path for path in dir_paths if os.path.basename(path) in names)
+    return existing
+
+
+def _select_thumbnail_image_paths(candidate_paths: List[str], count: int = 2) -> List[str]:
+    # dict.fromkeys で順序を保ったまま重複除去
+    unique_paths = list(dict.fromkeys(candidate_paths))
+    existing = _existing_files(unique_paths)
+    unique_paths = [p for p in unique_paths if p in existing]
 
     if not unique_paths:
         return []
@@ -222,13 +487,27 @@ def _select_thumbnail_image_paths(candidate_paths: List[str], count: int = 2) ->
         return unique_paths
 
     # 先に軽量なヒューリスティックで候補を絞り、Gemini評価コストを抑える
-    ranked_by_basic = sorted(unique_paths, key=lambda p: calculate_image_score(p), reverse=True)
+    # 基本スコアは1パスにつき1回だけ計算し、並べ替えと最終スコアの両方で使い回す
+    base_scores = {p: calculate_image_score(p) for p in unique_paths}
+    ranked_by_basic = sorted(unique_paths, key=base_scores.__getitem__, reverse=True)
+    pool_size = min(len(ranked_by_basic), max(count, THUMBNAIL_GEMINI_RANDOM_POOL))
+
+    # Gemini判定が無効な場合はスレッドプールや再スコアリングを経由せず、基本スコア上位から選ぶ
+    if not (THUMBNAIL_GEMINI_TEXT_FILTER and GEMINI_API_KEY):
+        selected = random.sample(ranked_by_basic[:pool_size], count)
+        print(f"[THUMBNAIL] Selected {len(selected)} images from top-{pool_size} pool (Gemini text filter disabled)")
+        return selected
+
     gemini_targets = ranked_by_basic[: min(len(ranked_by_basic), THUMBNAIL_GEMINI_MAX_CANDIDATES)]
 
+    # Gemini判定はI/O待ちが大半なのでスレッドで並列に投げる（結果は入力順を維持）
+    max_workers = max(1, min(THUMBNAIL_GEMINI_CONCURRENCY, len(gemini_targets)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        analyses = list(executor.map(_analyze_image_text_density_with_gemini, gemini_targets))
+
     scored: List[Tuple[str, float, bool, int]] = []
-    for path in gemini_targets:
-        base_score = float(calculate_image_score(path))
-        analysis = _analyze_image_text_density_with_gemini(path)
+    for path, analysis in zip(gemini_targets, analyses):
+        base_score = float(base_scores[path])
         if analysis:
             text_ratio = int(analysis.get("text_ratio", 50))
             text_heavy = bool(analysis.get("text_heavy", text_ratio >= 35))
@@ -243,7 +522,7 @@ def _select_thumbnail_image_paths(candidate_paths: List[str], count: int = 2) ->
     scored.sort(key=lambda x: (x[2], -x[1], x[3]))
 
     # 上位候補からランダムに選び、毎回同じ組み合わせになりにくくする
-    pool_size = min(len(scored), max(count, THUMBNAIL_GEMINI_RANDOM_POOL))
+    pool_size = min(len(scored), pool_size)
     top_pool = [path for path, _, _, _ in scored[:pool_size]]
     selected = random.sample(top_pool, count) if len(top_pool) >= count else top_pool[:]
     if len(selected) < count:
@@ -257,34 +536,125 @@ def _select_thumbnail_image_paths(candidate_paths: List[str], count: int = 2) ->
     return selected[:count]
 
 
+# ダウンロード画像の永続キャッシュ（URL＋縮小サイズをキーに縮小済み画像を保存、PERSISTENT_CACHE 有効時のみ使用）
+THUMBNAIL_IMAGE_CACHE_DIR = os.environ.get(
+    "THUMBNAIL_IMAGE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "proset", "thumb_img"),
+)
+THUMBNAIL_IMAGE_CACHE_MAX_FILES = max(1, int(os.environ.get("THUMBNAIL_IMAGE_CACHE_MAX_FILES", "200")))
+
+
+def _prune_cache_dir(cache_dir: str, max_files: int, suffix: str) -> None:
+    """最近使った順に max_files 件だけ残して古いキャッシュファイルを削除"""
+    try:
+        entries = [
+            entry for entry in os.scandir(cache_dir)
+            if entry.is_file() and entry.name.endswith(suffix)
+        ]
+        if len(entries) <= max_files:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[max_files:]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"[DEBUG] Failed to prune cache {cache_dir}: {e}")
+
+
+def _image_cache_path(url: str, max_size: tuple) -> str:
+    key = hashlib.blake2b(f"{url}|{max_size[0]}x{max_size[1]}".encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(THUMBNAIL_IMAGE_CACHE_DIR, f"{key}.img")
+
+
+def _load_cached_image(cache_path: str) -> Optional[Image.Image]:
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        img = Image.open(cache_path)
+        img.load()
+        os.utime(cache_path)  # 削除順序（最近使った順）の更新
+        return _to_canvas_mode(img)
+    except Exception as e:
+        print(f"[DEBUG] Failed to read image cache {cache_path}: {e}")
+        return None
+
+
+def _store_cached_image(cache_path: str, img: Image.Image) -> None:
+    """
+    軽いエンコードで保存（RGBはJPEG、透過付きはPNG最速圧縮）。
+    書き込み途中のファイルを読まないよう一時ファイル経由で置き換え、上限件数を超えたら古いものを削除する。
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        if img.mode == "RGB":
+            img.save(tmp_path, "JPEG", quality=90)
+        else:
+            img.save(tmp_path, "PNG", compress_level=1)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[DEBUG] Failed to write image cache {cache_path}: {e}")
+        return
+    _prune_cache_dir(THUMBNAIL_IMAGE_CACHE_DIR, THUMBNAIL_IMAGE_CACHE_MAX_FILES, ".img")
+
+
 def download_image(url: str, max_size: tuple = (640, 480)) -> Optional[Image.Image]:
-    """URLから画像をダウンロードしてリサイズ。"""
+    """URLから画像をダウンロードしてリサイズ。PERSISTENT_CACHE 有効時は縮小済み画像をディスクにキャッシュする。"""
+    cache_path = _image_cache_path(url, max_size) if PERSISTENT_CACHE else None
+    if cache_path:
+        cached = _load_cached_image(cache_path)
+        if cached is not None:
+            logger.debug("Image cache hit: %s -> %s", url, cache_path)
+            return cached
+
     try:
         print(f"[DEBUG] Downloading image from URL: {url}")
-        resp = requests.get(url, timeout=10)
-        if resp.status_code != 200:
-            print(f"[DEBUG] Failed to download image: HTTP {resp.status_code}")
-            return None
-        img = Image.open(BytesIO(resp.content))
-        print(f"[DEBUG] Image loaded: mode={img.mode}, size={img.size}")
-        img = img.convert("RGBA")  # RGBAに変換して透過をサポート
-        img.thumbnail(max_size, Image.Resampling.LANCZOS)
-        print(f"[DEBUG] Image resized to: {img.size}")
+        with _get_session().get(url, timeout=(3, 10), stream=True) as resp:
+            if resp.status_code != 200:
+                print(f"[DEBUG] Failed to download image: HTTP {resp.status_code}")
+                return None
+            # レスポンス本体をbytes化せず、ソケットから直接PILに読ませる
+            resp.raw.decode_content = True
+            img = Image.open(resp.raw)
+            # JPEGはDCT段階で1/2〜1/8に縮小デコードさせる（thumbnail先より小さくはならない）
+            img.draft("RGB", max_size)
+            # 接続をプールに返す前にデコードを完了させる
+            img.load()
+        logger.debug("Image loaded: mode=%s, size=%s", img.mode, img.size)
+        img = _to_canvas_mode(img)  # 透過がある場合のみRGBA、それ以外はRGB
+        # 既に上限以下の小さな画像（検索結果のサムネイル等）は縮小処理を通さない
+        if img.width > max_size[0] or img.height > max_size[1]:
+            img.thumbnail(max_size, THUMBNAIL_RESAMPLE)
+            logger.debug("Image resized to: %s", img.size)
+        if cache_path:
+            _store_cached_image(cache_path, img)
         return img
     except Exception as e:
         print(f"[DEBUG] Error downloading image: {e}")
         return None
 
 
+def download_images(urls: List[str], max_size: tuple = (640, 480)) -> List[Optional[Image.Image]]:
+    """複数URLの画像を並列にダウンロード（結果は入力順、失敗はNone）"""
+    if not urls:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        return list(executor.map(lambda url: download_image(url, max_size), urls))
+
+
+# ファイル名キーワードの判定用（キーワード毎の部分一致走査を1回の正規表現検索にまとめる）
+_BRAND_KEYWORD_RE = re.compile(r"iphone|android|samsung|google|apple|xiaomi|oppo|vivo|huawei|honor")
+_PRODUCT_KEYWORD_RE = re.compile(r"product|official|device|pro")
+
+
 def calculate_image_score(image_path: str) -> int:
     """画像のスコアを計算（サムネイル優先度の簡易判定）"""
     score = 0
     basename = os.path.basename(image_path).lower()
 
     # キーワードスコア
-    if any(kw in basename for kw in ['iphone', 'android', 'samsung', 'google', 'apple', 'xiaomi', 'oppo', 'vivo', 'huawei', 'honor']):
+    if _BRAND_KEYWORD_RE.search(basename):
         score += 5
-    if any(kw in basename for kw in ['product', 'official', 'device', 'pro']):
+    if _PRODUCT_KEYWORD_RE.search(basename):
         score += 3
 
     # ファイルサイズスコア
@@ -315,16 +685,17 @@ def select_images_from_video(image_schedule: List[Dict], s3_bucket: str = None)
     temp_dir = os.path.join(os.path.dirname(__file__), "temp")
     os.makedirs(temp_dir, exist_ok=True)
 
-    # ステップ1: ローカルファイルをチェック
-    local_images = []
+    # ステップ1: ローカルファイルをチェック（存在判定はディレクトリ単位の一括列挙で行う）
+    local_candidates = []
     for item in image_schedule:
         path = item.get('path', '')
         if not path:
             continue
 
         local_path = path if os.path.isabs(path) else os.path.join(temp_dir, os.path.basename(path))
-        if os.path.exists(local_path):
-            local_images.append(local_path)
+        local_candidates.append(local_path)
+    existing_local = _existing_files(local_candidates)
+    local_images = [p for p in local_candidates if p in existing_local]
 
     # 文字量の少ない画像を優先して2枚を選択
     if len(local_images) >= 2:
@@ -342,30 +713,34 @@ def select_images_from_video(image_schedule: List[Dict], s3_bucket: str = None)
             import boto3
             s3_client = boto3.client('s3')
 
-            # 利用可能なS3画像を収集
-            s3_images = []
+            # 利用可能なS3画像を収集（既にローカルにあるものはダウンロード対象から外す）
+            candidates = []
             for item in image_schedule[:10]:  # 上位10件を試行
                 path = item.get('path', '')
                 if not path:
                     continue
 
                 filename = os.path.basename(path)
-                s3_key = f"temp/{filename}"
-                local_path = os.path.join(temp_dir, f"thumbnail_{filename}")
-
-                # 既にローカルにある場合はスキップ
-                if os.path.exists(local_path):
-                    s3_images.append(local_path)
-                    continue
-
+                candidates.append((f"temp/{filename}", os.path.join(temp_dir, f"thumbnail_{filename}")))
+            existing_thumb = _existing_files(local_path for _, local_path in candidates)
+            candidates = [(s3_key, local_path, local_path in existing_thumb) for s3_key, local_path in candidates]
+
+            def _download(candidate) -> Optional[str]:
+                s3_key, local_path, already_local = candidate
+                if already_local:
+                    return local_path
                 try:
                     s3_client.download_file(s3_bucket, s3_key, local_path)
                     if os.path.exists(local_path):
-                        s3_images.append(local_path)
                         print(f"[S3] Downloaded: {s3_key}")
+                        return local_path
                 except Exception as e:
                     print(f"[S3] Download failed for {s3_key}: {e}")
-                    continue
+                return None
+
+            # boto3クライアントはスレッドセーフなので、GETを並列に発行する（結果は元の順序）
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                s3_images = [p for p in executor.map(_download, candidates) if p]
 
             # S3からダウンロードした画像も含めて、文字量の少ない画像を優先選択
             all_available_images = local_images + s3_images
@@ -392,42 +767,178 @@ def create_dark_blue_background(width: int, height: int) -> Image.Image:
     return Image.new("RGB", (width, height), color)
 
 
+@functools.lru_cache(maxsize=16)
 def create_placeholder_image(width: int, height: int, color: tuple = (200, 200, 200)) -> Image.Image:
-    """プレースホルダー画像を生成。"""
-    img = Image.new("RGB", (width, height), color)
-    draw = ImageDraw.Draw(img)
-    # 中央にグリッドパターンを描画
-    for i in range(0, width, 40):
-        draw.line([(i, 0), (i, height)], fill=(180, 180, 180), width=1)
-    for i in range(0, height, 40):
-        draw.line([(0, i), (width, i)], fill=(180, 180, 180), width=1)
+    """
+    プレースホルダー画像を生成（引数が同じなら同一画像を返す）。
+    返り値は共有されるため、呼び出し側で変更しないこと。
+    """
+    arr = np.full((height, width, 3), color, dtype=np.uint8)
+    # グリッドパターンを描画（40px間隔の縦横線をストライド代入で一括書き込み）
+    arr[:, ::40] = (180, 180, 180)
+    arr[::40, :] = (180, 180, 180)
+    return Image.fromarray(arr)
+
+
+FALLBACK_IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "background.png")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """フォントを (パス, サイズ) 単位でキャッシュして読み込む"""
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_font() -> ImageFont.ImageFont:
+    """日本語フォントが読めない場合のPillow内蔵フォント（呼び出し毎に組み込みフォントを解析しない）"""
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_fallback() -> Image.Image:
+    """フォールバック背景を一度だけ読み込む（呼び出し側で copy() して使う）"""
+    if os.path.exists(FALLBACK_IMAGE_PATH):
+        try:
+            fallback_image = _to_canvas_mode(Image.open(FALLBACK_IMAGE_PATH))
+            fallback_image.load()
+            print(f"[DEBUG] Loaded fallback image: {FALLBACK_IMAGE_PATH}")
+            return fallback_image
+        except Exception as e:
+            print(f"[DEBUG] Failed to load fallback image: {e}")
+            print("[DEBUG] Using dark blue background as fallback")
+    else:
+        print("[DEBUG] Fallback image not found, using dark blue background")
+    return create_dark_blue_background(1920, 1080)
+
+
+def _to_canvas_mode(img: Image.Image) -> Image.Image:
+    """
+    透過情報を持つ画像だけRGBAにし、不透明な画像はRGBのまま扱う。
+    JPEG等で使われないアルファチャンネルを確保しないため。
+    """
+    if "A" in img.getbands() or "transparency" in img.info:
+        return img if img.mode == "RGBA" else img.convert("RGBA")
+    return img if img.mode == "RGB" else img.convert("RGB")
+
+
+def _cover_size(size: Tuple[int, int], target_size: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+    """目標サイズを覆う最小のサイズ（縮小のみ、拡大はしない）を返す"""
+    if not target_size:
+        return size
+    width, height = size
+    scale = max(target_size[0] / width, target_size[1] / height)
+    if scale >= 1.0:
+        return size
+    return math.ceil(width * scale), math.ceil(height * scale)
+
+
+def _reduce_for_canvas(img: Image.Image, target_size: Optional[Tuple[int, int]]) -> Image.Image:
+    """
+    キャンバスに必要な解像度までアスペクト比を保って先に縮小する。
+    目標サイズを覆う大きさは維持するので、後段のfitで拡大は発生しない。
+    """
+    reduced_size = _cover_size(img.size, target_size)
+    if reduced_size != img.size:
+        img.thumbnail(reduced_size, THUMBNAIL_RESAMPLE)
     return img
 
 
+# pyvipsによる縮小を使うか（インストールされている場合のみ有効）
+THUMBNAIL_USE_PYVIPS = os.environ.get("THUMBNAIL_USE_PYVIPS", "1").lower() not in ("0", "false", "off")
+
+
+def _open_image_with_pyvips(path: str, target_size: Tuple[int, int]) -> Optional[Image.Image]:
+    """
+    libvipsのshrink-on-load付きthumbnailで目標サイズを覆う大きさまで縮小し、Pillow画像に変換する。
+    対応できない画像はNoneを返し、呼び出し側でPillowの経路に戻す。
+    """
+    try:
+        header = pyvips.Image.new_from_file(path)
+        width, height = _cover_size((header.width, header.height), target_size)
+        vimg = pyvips.Image.thumbnail(path, width, height=height, size="down")
+        if vimg.interpretation != "srgb":
+            vimg = vimg.colourspace("srgb")
+        if vimg.format != "uchar":
+            vimg = vimg.cast("uchar")
+        mode = {3: "RGB", 4: "RGBA"}.get(vimg.bands)
+        if mode is None:
+            return None
+        img = Image.frombytes(mode, (vimg.width, vimg.height), vimg.write_to_memory())
+        return _to_canvas_mode(img)
+    except Exception as e:
+        print(f"[DEBUG] pyvips resize failed, falling back to Pillow: {path} ({e})")
+        return None
+
+
+def _open_image_for_canvas(path: str, target_size: Optional[Tuple[int, int]] = None) -> Image.Image:
+    """画像を開き、モード変換の前にキャンバスサイズまで縮小する"""
+    if pyvips is not None and THUMBNAIL_USE_PYVIPS and target_size:
+        img = _open_image_with_pyvips(path, target_size)
+        if img is not None:
+            return img
+    img = Image.open(path)
+    if target_size and img.format == "JPEG":
+        # libjpegのDCT段階で1/2〜1/8に縮小してからデコードさせる（目標を覆う大きさは維持）
+        img.draft("RGB", _cover_size(img.size, target_size))
+    if img.mode in ("1", "P"):
+        # パレット画像はresizeがNEARESTになるため先に変換
+        img = _to_canvas_mode(img)
+    img = _reduce_for_canvas(img, target_size)
+    return _to_canvas_mode(img)
+
+
+def _fit_to_slot(img: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    """配置枠にクロップ＋縮小を1パスで合わせる（サイズが一致していればそのまま）"""
+    if img.size == size:
+        return img
+    return ImageOps.fit(img, size, THUMBNAIL_RESAMPLE)
+
+
 def get_article_images(
     topic_summary: str,
     meta: Optional[Dict] = None,
     used_image_paths: List[str] = None,
     require_images: bool = False,
     max_retries: int = 3,
+    target_size: Optional[Tuple[int, int]] = None,
 ) -> Tuple[Image.Image, Image.Image]:
     """
     記事関連画像を2枚取得（サムネイル生成時に独立して画像検索を行う）。
+    target_size を指定すると、読み込み直後にそのサイズまで縮小する。
     """
     img1 = None
     img2 = None
 
+    # 同じパスを二重にデコードしないよう、この呼び出し内で読み込み結果を共有する
+    opened_images: Dict[str, Image.Image] = {}
+
+    def open_once(path: str) -> Image.Image:
+        if path not in opened_images:
+            opened_images[path] = _open_image_for_canvas(path, target_size)
+        return opened_images[path]
+
     # 先に動画で使用した画像を優先して再利用
     image_paths = used_image_paths or []
     if image_paths:
+        # URLが含まれる場合はまとめて並列ダウンロードしておく
+        image_urls = [path for path in image_paths if path and "://" in path]
+        downloaded_images = dict(zip(image_urls, download_images(image_urls, target_size or (640, 480))))
+        existing_paths = _existing_files(path for path in image_paths if path and "://" not in path)
+
         for path in image_paths:
-            if not path or not os.path.exists(path):
-                continue
-            try:
-                loaded = Image.open(path).convert("RGBA")
-            except Exception as e:
-                print(f"[THUMBNAIL] Failed to load used image: {path} ({e})")
+            if path in downloaded_images:
+                loaded = downloaded_images[path]
+                if loaded is None:
+                    continue
+            elif path not in existing_paths:
                 continue
+            else:
+                try:
+                    loaded = open_once(path)
+                except Exception as e:
+                    print(f"[THUMBNAIL] Failed to load used image: {path} ({e})")
+                    continue
             if img1 is None:
                 img1 = loaded
                 print(f"[THUMBNAIL] Using video image for img1: {path}")
@@ -476,26 +987,28 @@ def get_article_images(
                         if images:
                             print(f"[THUMBNAIL] Found {len(images)} images for keyword: {keyword}")
 
-                            # 最初の2枚をダウンロード
-                            downloaded_paths = []
-                            for img in images[:2]:
+                            # 最初の2枚を並列にダウンロード（同期関数なのでスレッドに逃がしてgatherする）
+                            async def fetch(image_info):
                                 try:
-                                    path = download_image_from_url(img['url'])
-                                    if path and os.path.exists(path):
-                                        downloaded_paths.append(path)
-                                        print(f"[THUMBNAIL] Downloaded image: {os.path.basename(path)}")
+                                    return await asyncio.to_thread(download_image_from_url, image_info['url'])
                                 except Exception as e:
                                     print(f"[THUMBNAIL] Failed to download image: {e}")
-                                    continue
+                                    return None
+
+                            downloaded_paths = []
+                            for path in await asyncio.gather(*(fetch(img) for img in images[:2])):
+                                if path and os.path.exists(path):
+                                    downloaded_paths.append(path)
+                                    print(f"[THUMBNAIL] Downloaded image: {os.path.basename(path)}")
 
                             # 画像を読み込んで返す
                             if len(downloaded_paths) >= 2:
-                                found1 = Image.open(downloaded_paths[0]).convert("RGBA")
-                                found2 = Image.open(downloaded_paths[1]).convert("RGBA")
+                                found1 = open_once(downloaded_paths[0])
+                                found2 = open_once(downloaded_paths[1])
                                 print(f"[THUMBNAIL] Successfully loaded 2 images for thumbnail")
                                 return found1, found2
                             elif len(downloaded_paths) == 1:
-                                found1 = Image.open(downloaded_paths[0]).convert("RGBA")
+                                found1 = open_once(downloaded_paths[0])
                                 print(f"[THUMBNAIL] Successfully loaded 1 image for thumbnail")
                                 return found1, None
                     except Exception as e:
@@ -541,13 +1054,14 @@ def get_article_images(
         # 存在する画像パスのみを収集（重複を避ける）
         available_paths = []
         used_paths = set()  # 使用済みパスを追跡
+        existing_paths = _existing_files(image_paths)
         
         for path in image_paths:
             if path in used_paths:
                 continue  # 既に使用済みのパスはスキップ
 
             # 画像が削除済みの場合は除外
-            if not os.path.exists(path):
+            if path not in existing_paths:
                 print(f"[WARNING] Image file does not exist (already deleted): {path}")
                 continue
             
@@ -559,7 +1073,7 @@ def get_article_images(
         
         for path in selected_paths:
             try:
-                loaded = Image.open(path).convert("RGBA")
+                loaded = open_once(path)
                 if img1 is None:
                     img1 = loaded
                     print(f"[DEBUG] Loaded video image 1: {path}")
@@ -572,40 +1086,47 @@ def get_article_images(
     if require_images and (img1 is None or img2 is None):
         raise RuntimeError("Failed to obtain required thumbnail images")
 
-    # IT系汎用背景素材（チップ風）をフォールバックに使用
-    fallback_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "background.png")
-    fallback_image = None
-    if os.path.exists(fallback_path):
-        try:
-            fallback_image = Image.open(fallback_path).convert("RGBA")
-            print(f"[DEBUG] Loaded fallback image: {fallback_path}")
-        except Exception as e:
-            print(f"[DEBUG] Failed to load fallback image: {e}")
-            print("[DEBUG] Using dark blue background as fallback")
-            fallback_image = create_dark_blue_background(1920, 1080).convert("RGBA")
-    else:
-        print("[DEBUG] Fallback image not found, using dark blue background")
-        fallback_image = create_dark_blue_background(1920, 1080).convert("RGBA")
-    
-    # 画像がない場合はフォールバック素材を使用
-    if img1 is None and fallback_image is not None:
-        img1 = fallback_image.copy()
-        print(f"[DEBUG] Using fallback image for img1")
-    if img2 is None and fallback_image is not None:
-        img2 = fallback_image.copy()
-        print(f"[DEBUG] Using fallback image for img2")
-
-    # プレースホルダー画像を生成（RGBAで透過対応）
+    # IT系汎用背景素材（チップ風）をフォールバックに使用（初回のみデコード）
+    if img1 is None or img2 is None:
+        fallback_source = _load_fallback()
+        fallback_size = _cover_size(fallback_source.size, target_size)
+        # 原寸のキャッシュはコピーせず、縮小済みの1枚を両方の枠で共有する
+        if fallback_size != fallback_source.size:
+            fallback_image = fallback_source.resize(fallback_size, THUMBNAIL_RESAMPLE)
+        else:
+            fallback_image = fallback_source.copy()
+
+        # 画像がない場合はフォールバック素材を使用
+        if img1 is None:
+            img1 = fallback_image
+            print(f"[DEBUG] Using fallback image for img1")
+        if img2 is None:
+            img2 = fallback_image
+            print(f"[DEBUG] Using fallback image for img2")
+
+    # プレースホルダー画像を生成（不透明なのでRGBのまま）
     if img1 is None:
-        img1 = create_placeholder_image(640, 480, (100, 150, 200)).convert("RGBA")
+        img1 = create_placeholder_image(640, 480, (100, 150, 200))
         print(f"[DEBUG] Created placeholder img1: size={img1.size}, mode={img1.mode}")
     if img2 is None:
-        img2 = create_placeholder_image(640, 480, (200, 100, 150)).convert("RGBA")
+        img2 = create_placeholder_image(640, 480, (200, 100, 150))
         print(f"[DEBUG] Created placeholder img2: size={img2.size}, mode={img2.mode}")
         
     return img1, img2
 
 
+def _text_width(font: ImageFont.FreeTypeFont, text: str) -> int:
+    """テキスト幅（getlengthはカーニング込みの送り幅をC側で1回で求める）"""
+    return math.ceil(font.getlength(text))
+
+
+@functools.lru_cache(maxsize=16)
+def _line_height(font: ImageFont.FreeTypeFont) -> int:
+    """フォントの行の高さ（アセント＋ディセント）。文字列に依存しないのでフォント毎にキャッシュする"""
+    ascent, descent = font.getmetrics()
+    return ascent + descent
+
+
 def draw_text_with_outline(
     draw: ImageDraw.Draw,
     text: str,
@@ -623,15 +1144,15 @@ def draw_text_with_outline(
         else:
             text = str(text)
         
-        x, y = position
-        # 縁取りを描画（8方向）
-        for adj_x in [-outline_width, 0, outline_width]:
-            for adj_y in [-outline_width, 0, outline_width]:
-                if adj_x == 0 and adj_y == 0:
-                    continue
-                draw.text((x + adj_x, y + adj_y), text, font=font, fill=outline_color, encoding='unic')
-        # メインテキストを描画
-        draw.text(position, text, font=font, fill=fill, encoding='unic')
+        # Pillowのstroke_widthで縁取りと本体を1回の描画で行う（グリフのラスタライズはC側で1回）
+        draw.text(
+            position,
+            text,
+            font=font,
+            fill=fill,
+            stroke_width=outline_width,
+            stroke_fill=outline_color,
+        )
     except Exception as e:
         print(f"[DEBUG] Text drawing failed: {e}, using fallback")
         # フォールバック：ASCIIのみで描画
@@ -643,6 +1164,132 @@ def draw_text_with_outline(
             draw.text(position, "THUMBNAIL", font=font, fill=fill)
 
 
+SUBTITLE_PADDING = 12
+SUBTITLE_BORDER_COLOR = (100, 150, 255)
+# ランダムに選ぶ候補（呼び出し毎にリストを作らないよう定数のタプルにしておく）
+MAIN_TEXT_COLORS = ("black", "red", "blue")
+SUBTITLE_TEXT_COLORS = ("black", "red")
+SUBTITLE_ANGLES = (-10, 10)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_sub_font_path(size: int) -> str:
+    """
+    サブ字幕に使うフォントパスをサイズ毎に一度だけ解決する（""はPillow内蔵フォント）。
+    読み込み結果は _load_font 側にキャッシュされる。
+    """
+    for font_path in (FONT_PATH_SUB, "/System/Library/Fonts/Hiragino Sans GB.ttc"):
+        if not font_path:
+            continue
+        try:
+            print(f"[DEBUG] Loading sub font from: {font_path}")
+            _load_font(font_path, size)
+            print(f"[DEBUG] Sub font loaded successfully")
+            return font_path
+        except Exception as e:
+            print(f"[DEBUG] Failed to load sub font: {e}")
+    print(f"[DEBUG] Using default font")
+    return ""
+
+
+@functools.lru_cache(maxsize=64)
+def _subtitle_frame(width: int, height: int, border_rgb: tuple) -> Image.Image:
+    """
+    文字を載せる前の座布団（白背景＋枠線）。サイズと枠色だけで決まるため使い回す。
+    返り値は共有されるため、copy() してから描画すること。
+    """
+    # 座布団は全面不透明なのでRGBで持つ（透過は回転時に別のアルファマスクで表現する）
+    frame = Image.new("RGB", (width, height), "white")
+    ImageDraw.Draw(frame).rectangle([(0, 0), (width, height)], outline=border_rgb, width=2)
+    return frame
+
+
+@functools.lru_cache(maxsize=256)
+def _render_subtitle_plate(
+    text: str,
+    font_path: str,
+    size: int,
+    color: str,
+    border_rgb: tuple,
+) -> Image.Image:
+    """
+    サブ字幕の座布団（回転前）を描画してキャッシュする。
+    返り値は共有されるため、呼び出し側で変更しないこと。
+    """
+    font = _load_font(font_path, size) if font_path else _load_default_font()
+    # 等倍で描画（FreeTypeのグリフは既にアンチエイリアス済みのため2倍描画は不要）
+    left, top, right, bottom = font.getbbox(text)
+    bg_width = (right - left) + SUBTITLE_PADDING * 2
+    bg_height = (bottom - top) + SUBTITLE_PADDING * 2
+
+    # 同じ大きさの座布団は描画済みのテンプレートを複製して文字だけ描く
+    plate = _subtitle_frame(bg_width, bg_height, border_rgb).copy()
+    plate_draw = ImageDraw.Draw(plate)
+    plate_draw.text((SUBTITLE_PADDING, SUBTITLE_PADDING), text, font=font, fill=color, encoding='unic')
+    return plate
+
+
+@functools.lru_cache(maxsize=128)
+def _render_subtitle_sprite(
+    text: str,
+    font_path: str,
+    size: int,
+    color: str,
+    border_rgb: tuple,
+    angle: int,
+) -> Tuple[Image.Image, Image.Image]:
+    """
+    回転済みのサブ字幕スプライトをキャッシュする（同じ煽り文句は描画も回転もしない）。
+    (RGBの色画像, Lのアルファマスク) を返す。返り値は共有されるため、呼び出し側で変更しないこと。
+    """
+    plate = _render_subtitle_plate(text, font_path, size, color, border_rgb)
+    return _rotate_sprite(plate, angle, (255, 255, 255)), _rotated_plate_mask(plate.size, angle)
+
+
+@functools.lru_cache(maxsize=64)
+def _rotated_plate_mask(size: Tuple[int, int], angle: int) -> Image.Image:
+    """不透明な座布団を回転したときのアルファマスク（サイズと角度だけで決まるので使い回す）"""
+    return _rotate_sprite(Image.new("L", size, 255), angle, 0)
+
+
+def _rotate_sprite(img: Image.Image, angle: float, fillcolor) -> Image.Image:
+    """
+    スプライトを反時計回りに回転し、はみ出さないようキャンバスを広げる（rotate(expand=True)相当）。
+    広がった部分は fillcolor で埋める。
+    OpenCVがあればSIMD実装のwarpAffineを使い、無ければPillowのrotateで処理する。
+    """
+    try:
+        import cv2  # type: ignore
+    except ImportError:
+        cv2 = None
+
+    if cv2 is not None:
+        try:
+            width, height = img.size
+            rad = math.radians(angle)
+            cos_a, sin_a = abs(math.cos(rad)), abs(math.sin(rad))
+            new_width = math.ceil(width * cos_a + height * sin_a)
+            new_height = math.ceil(width * sin_a + height * cos_a)
+            matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+            # 回転中心を拡張後キャンバスの中心へ平行移動
+            matrix[0, 2] += (new_width - width) / 2
+            matrix[1, 2] += (new_height - height) / 2
+            rotated = cv2.warpAffine(
+                np.asarray(img),
+                matrix,
+                (new_width, new_height),
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT,
+                borderValue=fillcolor,
+            )
+            return Image.fromarray(rotated)
+        except Exception as e:
+            print(f"[DEBUG] cv2 rotate failed, falling back to Pillow: {e}")
+
+    # 回転処理（等倍のままBICUBICで補間）
+    return img.rotate(angle, expand=True, fillcolor=fillcolor, resample=Image.Resampling.BICUBIC)
+
+
 def create_thumbnail(
     title: str,
     topic_summary: str,
@@ -665,8 +1312,70 @@ def create_thumbnail(
         output_path: 出力画像パス
         meta: メタ情報（source_url等を含む）
     """
-    # キャンバス作成
-    img = Image.new("RGB", (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT), (255, 255, 255))
+    create_thumbnails(
+        title,
+        topic_summary,
+        thumbnail_data,
+        sizes=[(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)],
+        output_paths=[output_path],
+        meta=meta,
+        used_image_paths=used_image_paths,
+        require_images=require_images,
+        max_image_retries=max_image_retries,
+    )
+
+
+def create_thumbnails(
+    title: str,
+    topic_summary: str,
+    thumbnail_data: Dict[str, Any],
+    sizes: List[Tuple[int, int]],
+    output_paths: List[str],
+    meta: Optional[Dict] = None,
+    used_image_paths: List[str] = None,
+    require_images: bool = False,
+    max_image_retries: int = 3,
+) -> None:
+    """
+    同じ素材・レイアウトのサムネイルを複数サイズで出力する。
+    画像の取得・デコードと合成は1280x720のマスターで1回だけ行い、各サイズはマスターから縮小する。
+
+    Args:
+        sizes: 出力サイズ (幅, 高さ) のリスト
+        output_paths: sizes と同じ順序の出力画像パス
+    """
+    if len(sizes) != len(output_paths):
+        raise ValueError("sizes and output_paths must have the same length")
+
+    master = _render_thumbnail(
+        title,
+        topic_summary,
+        thumbnail_data,
+        meta,
+        used_image_paths,
+        require_images,
+        max_image_retries,
+    )
+    for size, output_path in zip(sizes, output_paths):
+        size = tuple(size)
+        if size == master.size:
+            _save_thumbnail_png(master, output_path)
+        else:
+            _save_thumbnail_png(master.resize(size, THUMBNAIL_RESAMPLE, reducing_gap=2.0), output_path)
+
+
+def _render_thumbnail(
+    title: str,
+    topic_summary: str,
+    thumbnail_data: Dict[str, Any],
+    meta: Optional[Dict],
+    used_image_paths: Optional[List[str]],
+    require_images: bool,
+    max_image_retries: int,
+) -> Image.Image:
+    """1280x720のサムネイルを合成して返す（保存は呼び出し側）"""
+    # キャンバス作成（下部の黄色背景は描画済み）
+    img = _BASE_CANVAS.copy()
     draw = ImageDraw.Draw(img)
     
     # 上部70%エリア: 画像2枚をランダム比率で配置
@@ -680,24 +1389,18 @@ def create_thumbnail(
         used_image_paths,
         require_images=require_images,
         max_retries=max_image_retries,
+        target_size=(max(left_width, right_width), TOP_AREA_HEIGHT),
     )
     
-    # 画像をリサイズして配置
-    img1_resized = img1.resize((left_width, TOP_AREA_HEIGHT), Image.Resampling.LANCZOS)
-    img2_resized = img2.resize((right_width, TOP_AREA_HEIGHT), Image.Resampling.LANCZOS)
-    print(f"[DEBUG] Resized images: img1={img1_resized.size}, img2={img2_resized.size}")
+    # 画像を枠に合わせてクロップ＋リサイズして配置
+    img1_resized = _fit_to_slot(img1, (left_width, TOP_AREA_HEIGHT))
+    img2_resized = _fit_to_slot(img2, (right_width, TOP_AREA_HEIGHT))
+    logger.debug("Resized images: img1=%s, img2=%s", img1_resized.size, img2_resized.size)
     
-    # 透過画像を正しく貼り付け（第3引数にmaskを指定）
-    img.paste(img1_resized, (0, 0), img1_resized)
-    img.paste(img2_resized, (left_width, 0), img2_resized)
-    print(f"[DEBUG] Pasted images at positions: (0,0) and ({left_width},0)")
-    
-    # 下部30%エリア: 黄色背景（座布団）
-    yellow_color = (255, 220, 0)  # 鮮やかな黄色
-    draw.rectangle(
-        [(0, TOP_AREA_HEIGHT), (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)],
-        fill=yellow_color
-    )
+    # 透過画像のみmaskを指定して貼り付け（不透明なRGB画像はマスク不要）
+    img.paste(img1_resized, (0, 0), img1_resized if img1_resized.mode == "RGBA" else None)
+    img.paste(img2_resized, (left_width, 0), img2_resized if img2_resized.mode == "RGBA" else None)
+    logger.debug("Pasted images at positions: (0,0) and (%d,0)", left_width)
     
     # フォント読み込み（日本語フォントを優先）
     try:
@@ -710,36 +1413,22 @@ def create_thumbnail(
         else:
             main_font_size = 72  # 短いテキストは大きめ
             
-        print(f"[DEBUG] Loading main font from: {FONT_PATH_MAIN}, size={main_font_size}")
-        main_font = ImageFont.truetype(FONT_PATH_MAIN, main_font_size)
-        print(f"[DEBUG] Main font loaded successfully")
+        logger.debug("Loading main font from: %s, size=%d", FONT_PATH_MAIN, main_font_size)
+        main_font = _load_font(FONT_PATH_MAIN, main_font_size)
+        logger.debug("Main font loaded successfully")
     except Exception as e:
         print(f"[DEBUG] Failed to load main font: {e}")
         try:
             fallback_path = "/System/Library/Fonts/Hiragino Sans GB.ttc"
             print(f"[DEBUG] Trying fallback font: {fallback_path}")
-            main_font = ImageFont.truetype(fallback_path, main_font_size)
+            main_font = _load_font(fallback_path, main_font_size)
             print(f"[DEBUG] Fallback main font loaded")
         except Exception:
             print(f"[DEBUG] Using default font")
-            main_font = ImageFont.load_default()
+            main_font = _load_default_font()
     
-    try:
-        # サブ字幕サイズはメインと同サイズに揃える
-        sub_font_size = main_font_size
-        print(f"[DEBUG] Loading sub font from: {FONT_PATH_SUB}")
-        sub_font = ImageFont.truetype(FONT_PATH_SUB, sub_font_size)
-        print(f"[DEBUG] Sub font loaded successfully")
-    except Exception as e:
-        print(f"[DEBUG] Failed to load sub font: {e}")
-        try:
-            fallback_path = "/System/Library/Fonts/Hiragino Sans GB.ttc"
-            print(f"[DEBUG] Trying fallback font: {fallback_path}")
-            sub_font = ImageFont.truetype(fallback_path, sub_font_size)
-            print(f"[DEBUG] Fallback sub font loaded")
-        except Exception:
-            print(f"[DEBUG] Using default font")
-            sub_font = ImageFont.load_default()
+    # サブ字幕サイズはメインと同サイズに揃える（フォントはサブ字幕を描く場合のみ解決する）
+    sub_font_size = main_font_size
     
     # メイン字幕（下部中央、2chスレタイ風）
     main_text = thumbnail_data.get("main_text", title)
@@ -765,21 +1454,19 @@ def create_thumbnail(
         main_text_line2 = ""
     
     # テキスト色をランダムに選択（黒・赤・青）
-    main_colors = ["black", "red", "blue"]
-    main_color = random.choice(main_colors)
+    main_color = random.choice(MAIN_TEXT_COLORS)
     
     # テキストサイズを調整（2行対応）
+    # 幅はgetlength、高さはフォントのメトリクスから求める（行ごとのbbox計算はしない）
+    line_height = _line_height(main_font)
     if main_text_line2:
         # 2行の場合は各行のサイズを計算
-        bbox1 = draw.textbbox((0, 0), main_text_line1, font=main_font)
-        bbox2 = draw.textbbox((0, 0), main_text_line2, font=main_font)
-        text_width = max(bbox1[2] - bbox1[0], bbox2[2] - bbox2[0])
-        text_height = (bbox1[3] - bbox1[1]) + (bbox2[3] - bbox2[1]) + 10  # 行間10px
+        text_width = max(_text_width(main_font, main_text_line1), _text_width(main_font, main_text_line2))
+        text_height = line_height * 2 + 10  # 行間10px
     else:
         # 1行の場合
-        bbox = draw.textbbox((0, 0), main_text_line1, font=main_font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        text_width = _text_width(main_font, main_text_line1)
+        text_height = line_height
     
     # 中央配置（上に寄せる）
     text_x = (THUMBNAIL_WIDTH - text_width) // 2
@@ -789,7 +1476,7 @@ def create_thumbnail(
     if main_text_line2:
         # 2行で描画
         line1_y = text_y
-        line2_y = text_y + (draw.textbbox((0, 0), main_text_line1, font=main_font)[3] - draw.textbbox((0, 0), main_text_line1, font=main_font)[1]) + 10
+        line2_y = text_y + line_height + 10
         
         draw_text_with_outline(
             draw, main_text_line1, (text_x, line1_y), main_font,
@@ -817,51 +1504,22 @@ def create_thumbnail(
             sub_text = sub_text[:20]
         
         try:
-            # 高解像度での描画準備（2倍サイズで作成して後で縮小することでアンチエイリアスを効かせる）
-            sub_bbox = draw.textbbox((0, 0), sub_text, font=sub_font)
-            sub_text_width = sub_bbox[2] - sub_bbox[0]
-            sub_text_height = sub_bbox[3] - sub_bbox[1]
-            
-            padding = 12
-            bg_width = sub_text_width + padding * 2
-            bg_height = sub_text_height + padding * 2
-            
-            scale_factor = 2
-            high_res_width = bg_width * scale_factor
-            high_res_height = bg_height * scale_factor
-            
-            sub_img = Image.new("RGBA", (high_res_width, high_res_height), (0, 0, 0, 0))
-            sub_draw = ImageDraw.Draw(sub_img)
-            
-            high_res_font_size = sub_font.size * scale_factor
-            high_res_font = ImageFont.truetype(FONT_PATH_SUB, high_res_font_size)
-            
-            # 座布団（白背景）と枠線の描画
-            sub_draw.rectangle([(0, 0), (high_res_width, high_res_height)], fill="white")
-            border_color = (100, 150, 255)
-            sub_draw.rectangle([(0, 0), (high_res_width, high_res_height)], outline=border_color, width=2)
-            
-            text_color = random.choice(["black", "red"])
-            high_res_padding = padding * scale_factor
-            sub_draw.text((high_res_padding, high_res_padding), sub_text, font=high_res_font, fill=text_color, encoding='unic')
+            sub_font_path = _resolve_sub_font_path(sub_font_size)
+            text_color = random.choice(SUBTITLE_TEXT_COLORS)
             
             # --- 【修正ポイント】角度を -10度 or 10度 に設定 ---
-            angle = random.choice([-10, 10])
+            angle = random.choice(SUBTITLE_ANGLES)
             
-            # 回転処理
-            rotated_sub_img = sub_img.rotate(angle, expand=True, fillcolor=(0, 0, 0, 0), resample=Image.Resampling.BICUBIC)
-            
-            # リサイズして元のスケールに戻す
-            final_sub_img = rotated_sub_img.resize(
-                (rotated_sub_img.width // scale_factor, rotated_sub_img.height // scale_factor), 
-                Image.Resampling.LANCZOS
+            # 回転済みスプライトは (テキスト, フォント, 色, 角度) が同じなら使い回す
+            final_sub_img, final_sub_mask = _render_subtitle_sprite(
+                sub_text, sub_font_path, sub_font_size, text_color, SUBTITLE_BORDER_COLOR, angle
             )
             
             # 配置位置の計算
             # 横軸(X): 画面の左右端100pxを空けた範囲でランダム
             x_min = 100
             x_max = max(x_min + 1, THUMBNAIL_WIDTH - final_sub_img.width - 100)
-            sub_x_random = random.randint(x_min, x_max)
+            sub_x_random = random.randrange(x_min, x_max + 1)
 
             # 縦軸(Y): 下部のメイン背景(黄色帯)にかからない上部エリア内でランダム
             y_min = 20
@@ -869,25 +1527,80 @@ def create_thumbnail(
             if y_max < y_min:
                 adjusted_sub_y = max(0, TOP_AREA_HEIGHT - final_sub_img.height)
             else:
-                adjusted_sub_y = random.randint(y_min, y_max)
+                adjusted_sub_y = random.randrange(y_min, y_max + 1)
             
             # 貼り付け
-            img.paste(final_sub_img, (sub_x_random, adjusted_sub_y), final_sub_img)
+            img.paste(final_sub_img, (sub_x_random, adjusted_sub_y), final_sub_mask)
             
-            print(f"[DEBUG] Subtitle placed: angle={angle}, pos=({sub_x_random}, {adjusted_sub_y})")
+            logger.debug("Subtitle placed: angle=%d, pos=(%d, %d)", angle, sub_x_random, adjusted_sub_y)
             
         except Exception as e:
             print(f"[DEBUG] Subtitle rendering error: {e}")
     else:
         print("[DEBUG] No sub_texts provided, skipping subtitle rendering")
     
-    # 保存
-    img.save(output_path, "PNG", quality=95)
+    return img
+
+
+def _save_thumbnail_png(img: Image.Image, output_path: str) -> None:
+    # 保存（PNGはqualityを無視するため、zlib圧縮レベルを下げてエンコードを高速化）
+    # キャンバスはRGBのままなのでアルファ無しのPNGになる
+    img.save(output_path, "PNG", compress_level=THUMBNAIL_PNG_COMPRESS_LEVEL, optimize=False)
+    if THUMBNAIL_PNG_COMPRESS_LEVEL < 9 and os.path.getsize(output_path) > YOUTUBE_THUMBNAIL_MAX_BYTES:
+        # YouTubeのサムネイル上限(2MB)を超えた場合のみ高圧縮で保存し直す
+        print(f"[DEBUG] Thumbnail exceeds {YOUTUBE_THUMBNAIL_MAX_BYTES} bytes, re-saving with compress_level=9")
+        img.save(output_path, "PNG", compress_level=9)
     print(f"サムネイルを生成しました: {output_path}")
 
 
+def _worker_init() -> None:
+    """バッチ生成用ワーカーの初期化（フォントとフォールバック背景を先に読み込んでおく）"""
+    for font_path in {FONT_PATH_MAIN, FONT_PATH_SUB}:
+        if not font_path:
+            continue
+        for size in (56, 64, 72):
+            try:
+                _load_font(font_path, size)
+            except Exception as e:
+                print(f"[DEBUG] Failed to preload font {font_path} ({size}): {e}")
+    _load_fallback()
+
+
+def _create_thumbnail_job(job: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    output_path = job.get("output_path", "")
+    try:
+        create_thumbnail(**job)
+        return output_path, None
+    except Exception as e:
+        print(f"[THUMBNAIL] Batch job failed: {output_path} ({e})")
+        return output_path, str(e)
+
+
+def create_thumbnails_batch(
+    jobs: List[Dict[str, Any]],
+    processes: Optional[int] = None,
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    複数のサムネイルをプロセスプールで並列生成する。
+
+    Args:
+        jobs: create_thumbnail のキーワード引数の辞書リスト（パスと文字列のみ。Imageは渡さない）
+        processes: ワーカー数（省略時はCPUコア数）
+
+    Returns:
+        完了順の (output_path, エラーメッセージ or None) のリスト
+    """
+    if not jobs:
+        return []
+    detect_pillow_simd()  # 親プロセスで1回だけ出力（ワーカーでは実行しない）
+    processes = min(processes or os.cpu_count() or 1, len(jobs))
+    with multiprocessing.Pool(processes=processes, initializer=_worker_init) as pool:
+        return list(pool.imap_unordered(_create_thumbnail_job, jobs))
+
 if __name__ == "__main__":
     # テスト用
+    logging.basicConfig(level=logging.INFO)
+    detect_pillow_simd()
     test_data = {
         "main_text": "これマジでヤバい",
         "sub_texts": ["これマジ？", "逝ったああ", "やばすぎる"]
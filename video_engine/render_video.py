@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 import sys
@@ -7,7 +8,11 @@ import time
 import hashlib
 import shutil
 import re
+import subprocess
+import threading
+import concurrent.futures
 from datetime import datetime, timezone, timedelta
+from io import BytesIO
 from typing import Any, Dict, List
 import random
 import google.genai as genai
@@ -40,7 +45,8 @@ if os.name != 'nt':
 
 import boto3
 import numpy as np
-from PIL import Image, UnidentifiedImageError, WebPImagePlugin, ImageFilter
+from PIL import Image, UnidentifiedImageError, ImageFilter
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 import gc  # メモリ解放用
 from google.oauth2.credentials import Credentials
@@ -1512,6 +1518,8 @@ except ImportError:
             except:
                 return clip  # エラー時はリサイズなしで返す
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from create_thumbnail import create_thumbnail, select_images_from_video
 
@@ -1537,6 +1545,8 @@ DDB_TABLE_NAME = os.environ.get("MY_DDB_TABLE_NAME", "VideoHistory")
 
 YOUTUBE_AUTH_JSON = os.environ.get("YOUTUBE_AUTH_JSON", "")
 VOICEVOX_API_URL = os.environ.get("VOICEVOX_API_URL", "http://localhost:50021")
+# パーツ単位で並列に音声合成する数（VOICEVOXサーバーの処理能力に合わせて調整）
+VOICEVOX_WORKERS = max(1, int(os.environ.get("VOICEVOX_WORKERS", "4")))
 
 BACKGROUND_IMAGE_PATH = os.environ.get(
     "BACKGROUND_IMAGE_PATH",
@@ -1547,6 +1557,8 @@ KEIFONT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets"
 print(f"[DEBUG] keifont exists: {os.path.exists(KEIFONT_PATH)}")
 
 # クロスプラットフォーム対応のフォント検出
+# プロセス内でフォントの配置は変わらないため、探索結果はキャッシュしてstatを繰り返さない
+@functools.lru_cache(maxsize=1)
 def find_japanese_font() -> str:
     """日本語対応フォントをクロスプラットフォームで検出"""
     possible_fonts = [
@@ -1577,23 +1589,44 @@ def find_japanese_font() -> str:
     print(f"[DEBUG] Selected font path: (default)")
     return ""
 
+@functools.lru_cache(maxsize=1)
 def resolve_font_path() -> str:
     if os.path.exists(KEIFONT_PATH):
         print(f"[DEBUG] Selected font path: {KEIFONT_PATH}")
         return KEIFONT_PATH
     return find_japanese_font()
 
-FONT_PATH = os.environ.get("FONT_PATH", resolve_font_path())
+# FONT_PATHが指定されていればフォント探索自体を行わない（os.environ.getの既定値は常に評価されるため分岐）
+FONT_PATH = os.environ["FONT_PATH"] if "FONT_PATH" in os.environ else resolve_font_path()
+
+# 画像ダウンロード・VOICEVOX共用のHTTPセッション（Keep-Aliveで接続を再利用しTLSハンドシェイク・DNS解決を省く）
+# Retryのステータス再試行はGET等の冪等メソッドのみ対象。VOICEVOXのPOSTは呼び出し側で再試行する
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+)
+HTTP_SESSION.mount("https://", _http_adapter)
+HTTP_SESSION.mount("http://", _http_adapter)
+# キーワードごとの候補画像を同時にダウンロード・検証する最大数
+IMAGE_DOWNLOAD_WORKERS = int(os.environ.get("IMAGE_DOWNLOAD_WORKERS", "8"))
+# キーワード単位のGemini画像評価を同時に実行する最大数（評価関数内のバッチ間スリープによる負荷軽減を活かすため少なめ）
+IMAGE_EVAL_WORKERS = max(1, int(os.environ.get("IMAGE_EVAL_WORKERS", "2")))
+# 共有ブラウザ上で同時に開くBing画像検索の最大数（同時アクセスが多いとブロック・captchaを招くため制限）
+IMAGE_SEARCH_CONCURRENCY = max(1, int(os.environ.get("IMAGE_SEARCH_CONCURRENCY", "3")))
 
 # 画像取得用環境変数
 IMAGES_S3_BUCKET = os.environ.get("IMAGES_S3_BUCKET", S3_BUCKET)  # デフォルトはメインS3バケット
 IMAGES_S3_PREFIX = os.environ.get("IMAGES_S3_PREFIX", "assets/images/")  # 画像格納先プレフィックス
 LOCAL_TEMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")  # ローカルtempフォルダ（S3 tempフォルダと連携）
 
-# tempフォルダが存在しない場合は作成
-os.makedirs(LOCAL_TEMP_DIR, exist_ok=True)
+# tempフォルダが存在しない場合は作成（既にあればstat 1回で済ませる）
+if not os.path.isdir(LOCAL_TEMP_DIR):
+    os.makedirs(LOCAL_TEMP_DIR, exist_ok=True)
 
 # ImageMagickの環境変数を設定（GitHub Actions対応）
+# 検出結果はos.environに書き戻すので、以降の判定や子プロセスでは候補パスを再探索しない
 if not os.environ.get("IMAGEMAGICK_BINARY"):
     # 一般的なImageMagickのパスを設定
     possible_paths = [
@@ -1622,6 +1655,66 @@ VIDEO_WIDTH = int(os.environ.get("VIDEO_WIDTH", "1920"))
 VIDEO_HEIGHT = int(os.environ.get("VIDEO_HEIGHT", "1080"))
 FPS = int(os.environ.get("FPS", "30"))
 VIDEO_BITRATE = "8M"  # 高画質設定：8Mbps
+# エンコードスレッド数（既定はCPUコア数。ローカルで負荷を抑えたい場合は環境変数で小さくする）
+ENCODE_THREADS = int(os.environ.get("ENCODE_THREADS", str(os.cpu_count() or 4)))
+# H.264エンコーダ（auto: NVENC→QSV→libx264の順に使えるものを選択。libx264等を指定すれば固定）
+VIDEO_ENCODER = os.environ.get("VIDEO_ENCODER", "auto")
+
+@functools.lru_cache(maxsize=1)
+def select_video_codec() -> str:
+    """書き出しに使うH.264エンコーダを決定（ハードウェアエンコーダが実際に動く場合のみ採用）"""
+    if VIDEO_ENCODER != "auto":
+        print(f"[ENCODER] Using configured encoder: {VIDEO_ENCODER}")
+        return VIDEO_ENCODER
+
+    # MoviePyと同じffmpegバイナリで確認する
+    try:
+        import imageio_ffmpeg
+        ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        ffmpeg_exe = "ffmpeg"
+
+    try:
+        encoders = subprocess.run(
+            [ffmpeg_exe, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+        for codec in ("h264_nvenc", "h264_qsv"):
+            if not re.search(rf"\b{codec}\b", encoders):
+                continue
+            # 静的ビルドはGPUが無くても一覧に載るため、ごく短いテストエンコードで実際に使えるか確認
+            probe = subprocess.run(
+                [ffmpeg_exe, "-hide_banner", "-loglevel", "error",
+                 "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                 "-c:v", codec, "-f", "null", "-"],
+                capture_output=True, timeout=30
+            )
+            if probe.returncode == 0:
+                print(f"[ENCODER] Hardware encoder available: {codec}")
+                return codec
+            print(f"[ENCODER] {codec} is listed but not usable on this machine")
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"[ENCODER] WARNING: Failed to probe hardware encoders: {e}")
+
+    print("[ENCODER] Using software encoder: libx264")
+    return "libx264"
+
+
+def get_encode_settings(codec: str) -> tuple:
+    """
+    エンコーダ別のpresetとffmpeg_paramsを返す（品質はCRF23/8Mbps相当に揃える）
+    Returns:
+        (preset, ffmpeg_params)
+    """
+    if codec == "h264_nvenc":
+        return ("p1" if DEBUG_MODE else "p4"), ["-rc", "vbr", "-cq", "28" if DEBUG_MODE else "23", "-b:v", "8000k", "-pix_fmt", "yuv420p"]
+    if codec == "h264_qsv":
+        return ("veryfast" if DEBUG_MODE else "medium"), ["-global_quality", "28" if DEBUG_MODE else "23", "-b:v", "8000k", "-pix_fmt", "nv12"]
+    # DEBUG_MODE時も8Mbpsを強制する
+    if DEBUG_MODE:
+        return "ultrafast", ['-crf', '28', '-preset', 'ultrafast', '-b:v', '8000k']
+    return "medium", ['-crf', '23', '-b:v', '8000k']
+
 
 # デバッグモード（Trueの時は最初の60秒のみ書き出し）
 DEBUG_MODE = False
@@ -1629,70 +1722,267 @@ DEBUG_MODE = False
 # デバッグモードでの処理制限
 DEBUG_MAX_PARTS = 2 if DEBUG_MODE else None  # 最初の2パーツのみ処理
 
-
-s3_client = boto3.client("s3", region_name=AWS_REGION, config=Config(signature_version="s3v4"))
+# セグメントキーワード生成で同時にGeminiへ投げるパーツ数（通常は1〜2パーツで5個集まるため小さめ）
+KEYWORD_BATCH_SIZE = int(os.environ.get("KEYWORD_BATCH_SIZE", "3"))
+
+
+# プロセス内で1つのセッション・クライアントを共有（boto3クライアントはスレッドセーフ）
+# 背景動画16本＋固定アセット4×8本のレンジGETが同時に走っても接続プールが枯渇しないよう64に広げる
+s3_session = boto3.session.Session()
+s3_client = s3_session.client(
+    "s3",
+    region_name=AWS_REGION,
+    config=Config(
+        signature_version="s3v4",
+        max_pool_connections=64,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+    ),
+)
 dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
 
+# 大きな背景動画は8MB単位のレンジGETを並列実行（閾値未満の小さなファイルは通常の逐次ダウンロード）
+BACKGROUND_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True,
+)
+# 固定アセット（ヘッダー画像・BGM・オープニング/ブリッジ動画）用。背景動画と同時に落とすので並列数は控えめ
+ASSET_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=4 * 1024 * 1024,
+    max_concurrency=8,
+)
+
+
+def _download_with_transfer(bucket: str, key: str, dest: str) -> None:
+    """ASSET_TRANSFER_CONFIGでS3オブジェクトをダウンロード（閾値以上はレンジGETを並列実行）"""
+    s3_client.download_file(bucket, key, dest, Config=ASSET_TRANSFER_CONFIG)
+
+
+# 取得画像のS3 tempフォルダへのアップロードはダウンロードの待ち時間に乗せないようバックグラウンドで実行
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+_S3_UPLOAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+_s3_upload_futures = []
+_s3_upload_lock = threading.Lock()
 
-def download_random_background_video() -> str:
-    """S3のassetsフォルダからs*.mp4形式の背景動画をランダムに1つ選択してダウンロード"""
-    try:
-        # assets/フォルダからs*.mp4ファイルをリストアップ
-        print(f"[BACKGROUND] Listing s*.mp4 files in s3://{S3_BUCKET}/assets/")
-        resp = s3_client.list_objects_v2(
-            Bucket=S3_BUCKET,
-            Prefix="assets/",
-            MaxKeys=100
-        )
 
-        mp4_files = []
-        contents = resp.get("Contents", [])
+def upload_file_to_s3_async(local_path: str, s3_key: str) -> None:
+    """アップロードを投げて即座に戻る（結果はwait_for_s3_uploadsでまとめて確認）"""
+    future = _S3_UPLOAD_POOL.submit(s3_client.upload_file, local_path, S3_BUCKET, s3_key, Config=UPLOAD_TRANSFER_CONFIG)
+    with _s3_upload_lock:
+        _s3_upload_futures.append((s3_key, future))
 
-        if not contents:
-            print("[BACKGROUND] ERROR: No objects found in assets/ folder")
-            print("[BACKGROUND] Please ensure S3_BUCKET is correctly configured and assets folder exists")
+
+def wait_for_s3_uploads() -> None:
+    """未完了のバックグラウンドアップロードを待ち、失敗をログに出す（ローカルファイル削除前に呼ぶ）"""
+    with _s3_upload_lock:
+        pending = list(_s3_upload_futures)
+        _s3_upload_futures.clear()
+    for s3_key, future in pending:
+        try:
+            future.result()
+            print(f"Uploaded image to S3: s3://{S3_BUCKET}/{s3_key}")
+        except Exception as e:
+            print(f"Failed to upload image to S3: {e}")
+
+
+# 実行をまたぐローカルキャッシュの有効化フラグ
+# GitHub Actionsのランナーは毎回まっさらでキャッシュが当たらないため、永続ディスクのある環境でのみ有効にする
+PERSISTENT_CACHE = os.environ.get("PERSISTENT_CACHE", "0").lower() in ("1", "true", "on")
+
+# 背景動画キー一覧のキャッシュ（LOCAL_TEMP_DIRは毎回削除されるのでユーザーキャッシュ配下に置く）
+BACKGROUND_CACHE_DIR = os.environ.get(
+    "BACKGROUND_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "proset", "background"),
+)
+BACKGROUND_KEYS_CACHE_PATH = os.path.join(BACKGROUND_CACHE_DIR, "bg_keys.json")
+BACKGROUND_KEYS_CACHE_TTL = int(os.environ.get("BACKGROUND_KEYS_CACHE_TTL", "3600"))
+# 背景動画本体はETagをファイル名にしてキャッシュ（1本数百MBになりうるので保持本数を制限）
+BACKGROUND_VIDEO_CACHE_DIR = os.path.join(BACKGROUND_CACHE_DIR, "videos")
+BACKGROUND_VIDEO_CACHE_MAX_FILES = int(os.environ.get("BACKGROUND_VIDEO_CACHE_MAX_FILES", "5"))
+
+
+def _load_cached_background_keys() -> List[str]:
+    """TTL内のキー一覧キャッシュがあれば返す（無効・無い・期限切れ・壊れている場合はNone）"""
+    if not PERSISTENT_CACHE:
+        return None
+    try:
+        with open(BACKGROUND_KEYS_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if time.time() - float(cached["timestamp"]) >= BACKGROUND_KEYS_CACHE_TTL:
             return None
+        keys = cached["keys"]
+        return keys if keys else None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
 
-        print(f"[BACKGROUND] Found {len(contents)} total objects in assets/ folder")
+def _save_cached_background_keys(keys: List[str]) -> None:
+    """キー一覧をタイムスタンプ付きで保存（失敗しても動画生成は続行）"""
+    if not PERSISTENT_CACHE:
+        return
+    try:
+        os.makedirs(BACKGROUND_CACHE_DIR, exist_ok=True)
+        tmp_path = BACKGROUND_KEYS_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": time.time(), "keys": keys}, f)
+        os.replace(tmp_path, BACKGROUND_KEYS_CACHE_PATH)
+    except OSError as e:
+        print(f"[BACKGROUND] WARNING: Failed to write key cache: {e}")
 
+
+def _invalidate_cached_background_keys() -> None:
+    try:
+        os.remove(BACKGROUND_KEYS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _list_background_keys() -> List[str]:
+    """S3のassetsフォルダからs*.mp4形式のキーを列挙（見つからない場合はNone）"""
+    # assets/フォルダからs*.mp4ファイルをリストアップ
+    print(f"[BACKGROUND] Listing s*.mp4 files in s3://{S3_BUCKET}/assets/")
+    resp = s3_client.list_objects_v2(
+        Bucket=S3_BUCKET,
+        Prefix="assets/",
+        MaxKeys=100
+    )
+
+    mp4_files = []
+    contents = resp.get("Contents", [])
+
+    if not contents:
+        print("[BACKGROUND] ERROR: No objects found in assets/ folder")
+        print("[BACKGROUND] Please ensure S3_BUCKET is correctly configured and assets folder exists")
+        return None
+
+    print(f"[BACKGROUND] Found {len(contents)} total objects in assets/ folder")
+
+    for obj in contents:
+        key = obj["Key"]
+        # s*.mp4またはS*.mp4パターンに一致するファイルを対象
+        filename = os.path.basename(key)
+        if filename.lower().startswith("s") and filename.lower().endswith(".mp4"):
+            mp4_files.append(key)
+
+    if not mp4_files:
+        print("[BACKGROUND] WARNING: No s*.mp4 files found in assets/ folder")
+        print("[BACKGROUND] Available MP4 files in assets/:")
+        mp4_count = 0
         for obj in contents:
-            key = obj["Key"]
-            # s*.mp4またはS*.mp4パターンに一致するファイルを対象
-            filename = os.path.basename(key)
-            if filename.lower().startswith("s") and filename.lower().endswith(".mp4"):
-                mp4_files.append(key)
-
-        if not mp4_files:
-            print("[BACKGROUND] WARNING: No s*.mp4 files found in assets/ folder")
-            print("[BACKGROUND] Available MP4 files in assets/:")
-            mp4_count = 0
-            for obj in contents:
-                filename = os.path.basename(obj["Key"])
-                if filename.lower().endswith(".mp4"):
-                    print(f"                        - {obj['Key']} (filename: {filename})")
-                    mp4_count += 1
-
-            if mp4_count == 0:
-                print("[BACKGROUND] No MP4 files at all in assets/ folder")
-                print("[BACKGROUND] All objects in assets/:")
-                for obj in contents[:10]:  # 最初の10個表示
-                    print(f"                        - {obj['Key']}")
+            filename = os.path.basename(obj["Key"])
+            if filename.lower().endswith(".mp4"):
+                print(f"                        - {obj['Key']} (filename: {filename})")
+                mp4_count += 1
 
-            return None
+        if mp4_count == 0:
+            print("[BACKGROUND] No MP4 files at all in assets/ folder")
+            print("[BACKGROUND] All objects in assets/:")
+            for obj in contents[:10]:  # 最初の10個表示
+                print(f"                        - {obj['Key']}")
 
-        # ランダムに1つ選択
-        selected_key = random.choice(mp4_files)
-        print(f"[BACKGROUND] Selected from {len(mp4_files)} available s*.mp4 files: {selected_key}")
+        return None
 
-        # ダウンロード
+    _save_cached_background_keys(mp4_files)
+    return mp4_files
+
+
+def _prune_background_video_cache(keep_path: str) -> None:
+    """最近使った順にBACKGROUND_VIDEO_CACHE_MAX_FILES本だけ残して古いキャッシュを削除"""
+    try:
+        entries = [
+            entry for entry in os.scandir(BACKGROUND_VIDEO_CACHE_DIR)
+            if entry.is_file() and entry.name.endswith(".mp4")
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[BACKGROUND_VIDEO_CACHE_MAX_FILES:]:
+            if entry.path != keep_path:
+                os.remove(entry.path)
+                print(f"[BACKGROUND] Evicted cached video: {entry.name}")
+    except OSError as e:
+        print(f"[BACKGROUND] WARNING: Failed to prune video cache: {e}")
+
+
+def _download_background_key(selected_key: str) -> str:
+    """
+    選択済みキーをETagキーのローカルキャッシュ経由で取得（S3側のエラーは例外のまま呼び出し元へ）
+    サイズが一致するキャッシュがあればダウンロードせずにそのパスを返す。
+    PERSISTENT_CACHE が無効な場合は head_object を省いて一時ディレクトリへ直接ダウンロードする。
+    """
+    if not PERSISTENT_CACHE:
         temp_dir = tempfile.mkdtemp()
-        filename = os.path.basename(selected_key)
-        local_path = os.path.join(temp_dir, filename)
+        local_path = os.path.join(temp_dir, os.path.basename(selected_key))
 
         print(f"[BACKGROUND] Downloading from S3: s3://{S3_BUCKET}/{selected_key}")
         print(f"[BACKGROUND] Local destination: {local_path}")
 
-        s3_client.download_file(S3_BUCKET, selected_key, local_path)
+        s3_client.download_file(S3_BUCKET, selected_key, local_path, Config=BACKGROUND_TRANSFER_CONFIG)
+        return local_path
+
+    head = s3_client.head_object(Bucket=S3_BUCKET, Key=selected_key)
+    etag = head["ETag"].strip('"')
+    expected_size = head["ContentLength"]
+    cache_path = os.path.join(BACKGROUND_VIDEO_CACHE_DIR, f"{etag}.mp4")
+
+    if os.path.exists(cache_path) and os.path.getsize(cache_path) == expected_size:
+        os.utime(cache_path)  # 削除順序（最近使った順）の更新
+        print(f"[BACKGROUND] Cache hit for s3://{S3_BUCKET}/{selected_key}: {cache_path}")
+        return cache_path
+
+    os.makedirs(BACKGROUND_VIDEO_CACHE_DIR, exist_ok=True)
+    # 途中で失敗しても壊れたファイルがキャッシュとして残らないよう、.partに落としてから置き換える
+    part_path = f"{cache_path}.{os.getpid()}.part"
+
+    print(f"[BACKGROUND] Downloading from S3: s3://{S3_BUCKET}/{selected_key}")
+    print(f"[BACKGROUND] Local destination: {cache_path}")
+
+    try:
+        s3_client.download_file(S3_BUCKET, selected_key, part_path, Config=BACKGROUND_TRANSFER_CONFIG)
+        os.replace(part_path, cache_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+    _prune_background_video_cache(cache_path)
+    return cache_path
+
+
+def download_random_background_video() -> str:
+    """S3のassetsフォルダからs*.mp4形式の背景動画をランダムに1つ選択してダウンロード"""
+    try:
+        mp4_files = _load_cached_background_keys()
+        from_cache = mp4_files is not None
+        if from_cache:
+            print(f"[BACKGROUND] Using cached key list ({len(mp4_files)} s*.mp4 files)")
+        else:
+            mp4_files = _list_background_keys()
+            if not mp4_files:
+                return None
+
+        # ランダムに1つ選択
+        selected_key = random.choice(mp4_files)
+        print(f"[BACKGROUND] Selected from {len(mp4_files)} available s*.mp4 files: {selected_key}")
+
+        # ダウンロード
+        try:
+            local_path = _download_background_key(selected_key)
+        except Exception as e:
+            if not from_cache:
+                raise
+            # キャッシュが古くキーが消えている可能性があるので、一覧を取り直して1回だけ再試行
+            print(f"[BACKGROUND] Download from cached key list failed ({type(e).__name__}), refreshing listing")
+            _invalidate_cached_background_keys()
+            mp4_files = _list_background_keys()
+            if not mp4_files:
+                return None
+            selected_key = random.choice(mp4_files)
+            print(f"[BACKGROUND] Selected from {len(mp4_files)} available s*.mp4 files: {selected_key}")
+            local_path = _download_background_key(selected_key)
 
         if not os.path.exists(local_path):
             print(f"[BACKGROUND] ERROR: File was not created after download: {local_path}")
@@ -1727,24 +2017,27 @@ def debug_background_video(bg_clip, total_duration):
     print(f"[DEBUG] 背景動画FPS: {bg_clip.fps}")
     print(f"[DEBUG] 目標長: {total_duration}s")
     
+    # 以降はフレームのシーク・デコードを伴うため、本番ではメタデータのみで終える
+    if not DEBUG_MODE:
+        print("[DEBUG] === 背景動画検査完了（メタデータのみ、フレーム検査はDEBUG_MODE時のみ） ===\n")
+        return
+    
     # フレームテストとサムネイル保存
+    sampled_frames = {}
     try:
-        import cv2
-        import numpy as np
-        
         test_times = [0, 1, 5, 10, 30]
+        sampled_frames = {t: bg_clip.get_frame(t) for t in test_times if t < bg_clip.duration}
         for t in test_times:
-            if t < bg_clip.duration:
-                frame = bg_clip.get_frame(t)
+            if t in sampled_frames:
+                frame = sampled_frames[t]
                 brightness = frame.mean()
                 print(f"[DEBUG] Frame at {t}s: brightness={brightness:.1f}, shape={frame.shape}")
                 
                 # サムネイルを保存（視覚的確認用）
                 if t == 1.0:  # 1秒時点のフレームを保存
                     thumbnail_path = "debug_background_frame.jpg"
-                    # RGBからBGRに変換（OpenCV形式）
-                    frame_bgr = cv2.cvtColor(frame.astype(np.uint8), cv2.COLOR_RGB2BGR)
-                    cv2.imwrite(thumbnail_path, frame_bgr)
+                    # PILはRGBをそのまま受け付けるのでBGR変換は不要（uint8ならコピーもしない）
+                    Image.fromarray(frame.astype(np.uint8, copy=False)).save(thumbnail_path, "JPEG", quality=85)
                     print(f"[DEBUG] サムネイル保存: {thumbnail_path}")
             else:
                 print(f"[DEBUG] Frame at {t}s: 動画長を超えています")
@@ -1753,10 +2046,10 @@ def debug_background_video(bg_clip, total_duration):
     
     # 色成分分析
     try:
-        frame = bg_clip.get_frame(1.0)  # 1秒時点
-        r_mean = frame[:,:,0].mean()
-        g_mean = frame[:,:,1].mean()
-        b_mean = frame[:,:,2].mean()
+        # 1秒時点（フレームテストで取得済みならデコードし直さない）
+        frame = sampled_frames[1] if 1 in sampled_frames else bg_clip.get_frame(1.0)
+        # 1回の走査で3チャンネルの平均を求める（float32累積でfloat64の中間配列を避ける）
+        r_mean, g_mean, b_mean = frame.reshape(-1, 3).mean(axis=0, dtype=np.float32)
         print(f"[DEBUG] 色成分 (1s時点): R={r_mean:.1f}, G={g_mean:.1f}, B={b_mean:.1f}")
         
         # 真っ黒チェック
@@ -1874,7 +2167,7 @@ def download_heading_image() -> str:
     
     try:
         print(f"Downloading heading image from S3: s3://{S3_BUCKET}/{heading_key}")
-        s3_client.download_file(S3_BUCKET, heading_key, local_path)
+        _download_with_transfer(S3_BUCKET, heading_key, local_path)
         print(f"Successfully downloaded heading image to: {local_path}")
         return local_path
     except Exception as e:
@@ -1889,7 +2182,7 @@ def download_background_music() -> str:
     
     try:
         print(f"Downloading background music from S3: s3://{S3_BUCKET}/{bgm_key}")
-        s3_client.download_file(S3_BUCKET, bgm_key, local_path)
+        _download_with_transfer(S3_BUCKET, bgm_key, local_path)
         print(f"Successfully downloaded BGM to: {local_path}")
         return local_path
     except Exception as e:
@@ -1904,7 +2197,7 @@ def download_title_video() -> str:
     
     try:
         print(f"Downloading title video from S3: s3://{S3_BUCKET}/{title_key}")
-        s3_client.download_file(S3_BUCKET, title_key, local_path)
+        _download_with_transfer(S3_BUCKET, title_key, local_path)
         print(f"Successfully downloaded title video to: {local_path}")
         return local_path
     except Exception as e:
@@ -1919,7 +2212,7 @@ def download_modulation_video() -> str:
     
     try:
         print(f"Downloading modulation video from S3: s3://{S3_BUCKET}/{modulation_key}")
-        s3_client.download_file(S3_BUCKET, modulation_key, local_path)
+        _download_with_transfer(S3_BUCKET, modulation_key, local_path)
         print(f"Successfully downloaded modulation video to: {local_path}")
         return local_path
     except Exception as e:
@@ -1927,6 +2220,24 @@ def download_modulation_video() -> str:
         return None
 
 
+def prefetch_s3_assets() -> Dict[str, str]:
+    """
+    動画生成に使うS3アセット（オープニング・ブリッジ・BGM・背景動画・ヘッダー画像）を並列にダウンロード。
+    各ダウンロード関数は失敗時にNoneを返すので、結果もキー毎にパスまたはNone。
+    """
+    downloaders = {
+        "title": download_title_video,
+        "modulation": download_modulation_video,
+        "bgm": download_background_music,
+        "background": download_random_background_video,
+        "heading": download_heading_image,
+    }
+    print(f"[S3] Prefetching {len(downloaders)} assets in parallel")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(downloaders)) as executor:
+        futures = {name: executor.submit(downloader) for name, downloader in downloaders.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 # グローバル変数
 _used_image_hashes = set()  # 動画全体で使用した画像のハッシュ値を記録
 _used_image_paths = []  # 動画全体で使用した画像のパスを記録（サムネイル用）
@@ -1956,6 +2267,8 @@ def set_quality_flag(key: str, detail: str = "") -> None:
 
 def cleanup_local_temp_dir() -> None:
     """LOCAL_TEMP_DIRを削除（サムネイル生成後に実行）"""
+    # アップロード中のファイルを消さないよう、バックグラウンドアップロードの完了を先に待つ
+    wait_for_s3_uploads()
     try:
         if os.path.exists(LOCAL_TEMP_DIR):
             files = [os.path.join(LOCAL_TEMP_DIR, name) for name in os.listdir(LOCAL_TEMP_DIR)]
@@ -2036,249 +2349,270 @@ def is_corporate_logo_or_icon(url: str, alt: str, width: int, height: int) -> bo
     
     return False  # 企業ロゴやアイコンは積極的に使用するため除外しない
 
-async def search_images_with_playwright(keyword: str, max_results: int = 10) -> List[Dict[str, str]]:
-    """Bing Image SearchからJSONメタデータで画像URLを取得（固有名詞のみ・直接抽出）"""
-    
-    import time
-    import json
-    import hashlib
-    
-    # グローバルキャッシュ（同一セッション内で再利用）
-    global _image_search_cache
-    cache_key = f"{keyword}_{max_results}"
-    
-    if cache_key in _image_search_cache:
-        print(f"[CACHE] Using cached results for '{keyword}'")
-        return _image_search_cache[cache_key]
-    
-    # Bingを使用
-    max_retries = 2
-    retry_delay = 1  # 秒
-
-    for attempt in range(max_retries):
-        try:
-            from playwright.async_api import async_playwright
-
-            # 検索キーワード：Geminiが抽出したキーワードをそのまま使用
-            search_keyword = keyword
-            print(f"[SEARCH] Using keyword: {search_keyword}")
-            
-            # ストックフォトを除外するために-shutterstockを付与
-            if '-shutterstock' not in search_keyword.lower():
-                search_keyword = f"{search_keyword} -shutterstock"
-
-            # フォールバック検索（2回目以降）
-            if attempt > 0:
-                print(f"[FALLBACK] Attempt {attempt + 1}: {search_keyword}")
-            else:
-                print(f"Searching Bing images for: {search_keyword} (attempt {attempt + 1}/{max_retries})")
-            
-            async with async_playwright() as p:
-                # シンプルなブラウザ設定
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[]
-                )
-                context = await browser.new_context()
-                page = await context.new_page()
+async def _search_bing_images_in_browser(browser, keyword: str, search_keyword: str, max_results: int, cache_key: str) -> List[Dict[str, str]]:
+    """起動済みブラウザ上に専用コンテキストを作ってBing画像検索を1件実行（ブラウザは閉じない）"""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
                 
-                # Bing画像検索URL
-                search_url = f"https://www.bing.com/images/search?q={search_keyword}"
-                print(f"[DEBUG] Navigating to: {search_url}")
-                await page.goto(search_url, timeout=30000)
+        # Bing画像検索URL
+        search_url = f"https://www.bing.com/images/search?q={search_keyword}"
+        print(f"[DEBUG] Navigating to: {search_url}")
+        await page.goto(search_url, timeout=30000)
                 
-                # ページ読み込み完了を待機
-                await page.wait_for_load_state('networkidle', timeout=15000)
-                await page.wait_for_timeout(3000)  # 画像読み込み待機
+        # ページ読み込み完了を待機
+        await page.wait_for_load_state('networkidle', timeout=15000)
+        await page.wait_for_timeout(3000)  # 画像読み込み待機
                 
-                # ブロック検出
-                page_title = await page.title()
-                current_url = page.url
-                print(f"[DEBUG] Page title: {page_title}")
-                print(f"[DEBUG] Current URL: {current_url}")
+        # ブロック検出
+        page_title = await page.title()
+        current_url = page.url
+        print(f"[DEBUG] Page title: {page_title}")
+        print(f"[DEBUG] Current URL: {current_url}")
                 
-                # Bingのブロック検出
-                if any(block_indicator in page_title.lower() for block_indicator in ['blocked', 'forbidden', 'error', 'captcha']):
-                    print(f"[WARNING] Bing may be blocking us - Title: {page_title}")
-                    await browser.close()
-                    return []
+        # Bingのブロック検出
+        if any(block_indicator in page_title.lower() for block_indicator in ['blocked', 'forbidden', 'error', 'captcha']):
+            print(f"[WARNING] Bing may be blocking us - Title: {page_title}")
+            return []
                 
-                # JSONメタデータから直接画像URLを抽出
-                print(f"[DEBUG] Extracting image URLs from JSON metadata...")
-                try:
-                    js_result = await page.evaluate("""
-                        () => {
-                            const images = [];
+        # JSONメタデータから直接画像URLを抽出
+        print(f"[DEBUG] Extracting image URLs from JSON metadata...")
+        try:
+            js_result = await page.evaluate("""
+                () => {
+                    const images = [];
                             
-                            // Bingの画像リンク要素を検索
-                            const imageLinks = document.querySelectorAll('a.iusc, a[m], div[m]');
+                    // Bingの画像リンク要素を検索
+                    const imageLinks = document.querySelectorAll('a.iusc, a[m], div[m]');
                             
-                            console.log(`Found ${imageLinks.length} image elements with metadata`);
+                    console.log(`Found ${imageLinks.length} image elements with metadata`);
                             
-                            for (const link of imageLinks) {
-                                try {
-                                    // m属性からJSONメタデータを取得
-                                    const metadata = link.getAttribute('m');
+                    for (const link of imageLinks) {
+                        try {
+                            // m属性からJSONメタデータを取得
+                            const metadata = link.getAttribute('m');
                                     
-                                    if (metadata) {
-                                        try {
-                                            const data = JSON.parse(metadata);
+                            if (metadata) {
+                                try {
+                                    const data = JSON.parse(metadata);
                                             
-                                            // 高解像度画像URLを抽出
-                                            if (data.murl) {
-                                                const imageUrl = data.murl;
+                                    // 高解像度画像URLを抽出
+                                    if (data.murl) {
+                                        const imageUrl = data.murl;
                                                 
-                                                // 画像サイズ情報も取得（あれば）
-                                                const width = data.t ? data.t.w || 0 : 0;
-                                                const height = data.t ? data.t.h || 0 : 0;
+                                        // 画像サイズ情報も取得（あれば）
+                                        const width = data.t ? data.t.w || 0 : 0;
+                                        const height = data.t ? data.t.h || 0 : 0;
                                                 
-                                                images.push({
-                                                    src: imageUrl,
-                                                    alt: data.t ? data.t || '' : '',
-                                                    method: 'bing_json_metadata',
-                                                    width: width,
-                                                    height: height,
-                                                    metadata: data
-                                                });
-                                            }
-                                        } catch (parseError) {
-                                            console.log('Failed to parse metadata:', parseError);
-                                            continue;
-                                        }
+                                        images.push({
+                                            src: imageUrl,
+                                            alt: data.t ? data.t || '' : '',
+                                            method: 'bing_json_metadata',
+                                            width: width,
+                                            height: height,
+                                            metadata: data
+                                        });
                                     }
-                                } catch (e) {
+                                } catch (parseError) {
+                                    console.log('Failed to parse metadata:', parseError);
                                     continue;
                                 }
                             }
+                        } catch (e) {
+                            continue;
+                        }
+                    }
                             
-                            // 代替方法：通常のimg要素もチェック
-                            const allImgs = document.querySelectorAll('img[src*="http"]');
-                            console.log(`Found ${allImgs.length} total img elements as fallback`);
+                    // 代替方法：通常のimg要素もチェック
+                    const allImgs = document.querySelectorAll('img[src*="http"]');
+                    console.log(`Found ${allImgs.length} total img elements as fallback`);
                             
-                            for (const img of allImgs) {
-                                try {
-                                    const src = img.src;
+                    for (const img of allImgs) {
+                        try {
+                            const src = img.src;
                                     
-                                    // Bingの画像URLパターンをチェック
-                                    if (src && src.startsWith('http') && 
-                                        (src.includes('bing.net') || src.includes('bing.com')) &&
-                                        !src.includes('logo') &&
-                                        !src.includes('icon') &&
-                                        !src.includes('placeholder') &&
-                                        src.length > 50) {
+                            // Bingの画像URLパターンをチェック
+                            if (src && src.startsWith('http') && 
+                                (src.includes('bing.net') || src.includes('bing.com')) &&
+                                !src.includes('logo') &&
+                                !src.includes('icon') &&
+                                !src.includes('placeholder') &&
+                                src.length > 50) {
                                         
-                                        // 重複チェック
-                                        if (!images.find(img => img.src === src)) {
-                                            images.push({
-                                                src: src,
-                                                alt: img.alt || '',
-                                                method: 'bing_fallback_img',
-                                                width: img.naturalWidth || 0,
-                                                height: img.naturalHeight || 0
-                                            });
-                                        }
-                                    }
-                                } catch (e) {
-                                    continue;
+                                // 重複チェック
+                                if (!images.find(img => img.src === src)) {
+                                    images.push({
+                                        src: src,
+                                        alt: img.alt || '',
+                                        method: 'bing_fallback_img',
+                                        width: img.naturalWidth || 0,
+                                        height: img.naturalHeight || 0
+                                    });
                                 }
                             }
-                            
-                            console.log(`Found ${images.length} total images before filtering`)
-                            for (let i = 0; i < Math.min(5, images.length); i++) {
-                                console.log(`Sample ${i}: ${images[i].src} (${images[i].width}x${images[i].height})`);
-                            }
-                            return images;
+                        } catch (e) {
+                            continue;
                         }
-                    """)
+                    }
+                            
+                    console.log(`Found ${images.length} total images before filtering`)
+                    for (let i = 0; i < Math.min(5, images.length); i++) {
+                        console.log(`Sample ${i}: ${images[i].src} (${images[i].width}x${images[i].height})`);
+                    }
+                    return images;
+                }
+            """)
                     
-                    if js_result and len(js_result) > 0:
-                        print(f"[SUCCESS] Bing extraction found {len(js_result)} raw images")
+            if js_result and len(js_result) > 0:
+                print(f"[SUCCESS] Bing extraction found {len(js_result)} raw images")
                         
-                        images = []
-                        for img_data in js_result:
-                            original_url = img_data.get('src')
-                            alt = img_data.get('alt', '')
-                            method = img_data.get('method', 'unknown')
-                            width = img_data.get('width', 0)
-                            height = img_data.get('height', 0)
+                images = []
+                for img_data in js_result:
+                    original_url = img_data.get('src')
+                    alt = img_data.get('alt', '')
+                    method = img_data.get('method', 'unknown')
+                    width = img_data.get('width', 0)
+                    height = img_data.get('height', 0)
                             
-                            if original_url:
-                                # フィルタリング：有効な画像拡張子とサイズチェック
-                                valid_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp']
-                                has_valid_extension = any(original_url.lower().endswith(ext) for ext in valid_extensions)
+                    if original_url:
+                        # フィルタリング：有効な画像拡張子とサイズチェック
+                        valid_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp']
+                        has_valid_extension = any(original_url.lower().endswith(ext) for ext in valid_extensions)
                                 
-                                # URLパターンでもチェック（拡張子がない場合）
-                                if not has_valid_extension:
-                                    # Bingの画像URLパターンをチェック
-                                    if ('bing.net' in original_url or 'bing.com' in original_url) and len(original_url) > 30:
-                                        has_valid_extension = True
-                                    # その他の画像ホスティングサービスも許可
-                                    elif any(domain in original_url for domain in ['thepowerofplaybook.com', 'msn.com', 'wordpress.com', 'cloudfront.com']):
-                                        has_valid_extension = True
-                                    # Apple公式サイトも許可
-                                    elif 'apple.com' in original_url:
-                                        has_valid_extension = True
-                                    # 主要なCDNも許可
-                                    elif any(cdn in original_url for cdn in ['cdn.', 'cloudfront', 'kxcdn']):
-                                        has_valid_extension = True
+                        # URLパターンでもチェック（拡張子がない場合）
+                        if not has_valid_extension:
+                            # Bingの画像URLパターンをチェック
+                            if ('bing.net' in original_url or 'bing.com' in original_url) and len(original_url) > 30:
+                                has_valid_extension = True
+                            # その他の画像ホスティングサービスも許可
+                            elif any(domain in original_url for domain in ['thepowerofplaybook.com', 'msn.com', 'wordpress.com', 'cloudfront.com']):
+                                has_valid_extension = True
+                            # Apple公式サイトも許可
+                            elif 'apple.com' in original_url:
+                                has_valid_extension = True
+                            # 主要なCDNも許可
+                            elif any(cdn in original_url for cdn in ['cdn.', 'cloudfront', 'kxcdn']):
+                                has_valid_extension = True
                                 
-                                if has_valid_extension:
-                                    # 人物画像とYouTube風サムネイルを除外
-                                    if width > 0 and height > 0:
-                                        if width < 50 or height < 50:
-                                            print(f"[DEBUG] Skipping very small image: {width}x{height}")
-                                            continue
-                                    elif width == 0 and height == 0:
-                                        # サイズ情報がない場合は許可（Bingメタデータ経由の場合）
-                                        pass
+                        if has_valid_extension:
+                            # 人物画像とYouTube風サムネイルを除外
+                            if width > 0 and height > 0:
+                                if width < 50 or height < 50:
+                                    print(f"[DEBUG] Skipping very small image: {width}x{height}")
+                                    continue
+                            elif width == 0 and height == 0:
+                                # サイズ情報がない場合は許可（Bingメタデータ経由の場合）
+                                pass
                                     
-                                    # 画像をリストに追加（重複チェック）
-                                    if not is_duplicate_image_url(original_url):
-                                        images.append({
-                                            'url': original_url,
-                                            'title': alt,
-                                            'is_google_thumbnail': False
-                                        })
-                                        add_used_image_url(original_url)
-                                    else:
-                                        print(f"[DEBUG] Skipping duplicate image: {original_url[:50]}...")
+                            # 画像をリストに追加（重複チェック）
+                            if not is_duplicate_image_url(original_url):
+                                images.append({
+                                    'url': original_url,
+                                    'title': alt,
+                                    'is_google_thumbnail': False
+                                })
+                                add_used_image_url(original_url)
+                            else:
+                                print(f"[DEBUG] Skipping duplicate image: {original_url[:50]}...")
                                     
-                                    # フィルタリング：人物画像はプロンプトで除外するため、ここではフィルタリングしない
-                                    if len(images) >= max_results:
-                                        break
-                                else:
-                                    print(f"[DEBUG] Skipping invalid URL: {original_url[:50]}...")
+                            # フィルタリング：人物画像はプロンプトで除外するため、ここではフィルタリングしない
+                            if len(images) >= max_results:
+                                break
+                        else:
+                            print(f"[DEBUG] Skipping invalid URL: {original_url[:50]}...")
                         
-                        if images:
-                            print(f"Successfully found {len(images)} valid images for '{keyword}'")
-                            # キャッシュに保存
-                            _image_search_cache[cache_key] = images
-                            print(f"[CACHE] Saved {len(images)} images for '{keyword}' to cache")
-                            await browser.close()
-                            return images
-                    else:
-                        print(f"[DEBUG] Bing extraction returned no results")
+                if images:
+                    print(f"Successfully found {len(images)} valid images for '{keyword}'")
+                    # キャッシュに保存
+                    _image_search_cache[cache_key] = images
+                    print(f"[CACHE] Saved {len(images)} images for '{keyword}' to cache")
+                    return images
+            else:
+                print(f"[DEBUG] Bing extraction returned no results")
                         
-                except Exception as e:
-                    print(f"[DEBUG] Bing extraction failed: {e}")
+        except Exception as e:
+            print(f"[DEBUG] Bing extraction failed: {e}")
                 
-                await browser.close()
-                print(f"[WARNING] No images found for '{keyword}'")
-                # 空の結果もキャッシュに保存
-                _image_search_cache[cache_key] = []
-                print(f"[CACHE] Saved empty result for '{keyword}' to cache")
-                return []
-                    
+        print(f"[WARNING] No images found for '{keyword}'")
+        # 空の結果もキャッシュに保存
+        _image_search_cache[cache_key] = []
+        print(f"[CACHE] Saved empty result for '{keyword}' to cache")
+        return []
+    finally:
+        await context.close()
+
+
+async def search_images_with_playwright(keyword: str, max_results: int = 10, browser=None) -> List[Dict[str, str]]:
+    """
+    Bing Image SearchからJSONメタデータで画像URLを取得（固有名詞のみ・直接抽出）
+    browserを渡した場合はそのブラウザを共有し、渡さない場合はこの呼び出し専用に起動・終了する
+    （リトライ間でもブラウザは使い回し、試行ごとに作り直すのはコンテキストだけ）。
+    """
+    
+    import asyncio
+    import json
+    import hashlib
+    
+    # グローバルキャッシュ（同一セッション内で再利用）
+    global _image_search_cache
+    cache_key = f"{keyword}_{max_results}"
+    
+    if cache_key in _image_search_cache:
+        print(f"[CACHE] Using cached results for '{keyword}'")
+        return _image_search_cache[cache_key]
+    
+    if browser is None:
+        try:
+            from playwright.async_api import async_playwright
         except ImportError:
             print("[ERROR] Playwright not available")
             return []
+
+        try:
+            async with async_playwright() as p:
+                # シンプルなブラウザ設定
+                own_browser = await p.chromium.launch(
+                    headless=True,
+                    args=[]
+                )
+                try:
+                    return await search_images_with_playwright(keyword, max_results=max_results, browser=own_browser)
+                finally:
+                    await own_browser.close()
+        except Exception as e:
+            print(f"[ERROR] Failed to launch browser for image search: {e}")
+            # エラー結果もキャッシュに保存
+            _image_search_cache[cache_key] = []
+            return []
+    
+    # Bingを使用
+    max_retries = 2
+    retry_delay = 1  # 秒
+
+    for attempt in range(max_retries):
+        try:
+            # 検索キーワード：Geminiが抽出したキーワードをそのまま使用
+            search_keyword = keyword
+            print(f"[SEARCH] Using keyword: {search_keyword}")
+            
+            # ストックフォトを除外するために-shutterstockを付与
+            if '-shutterstock' not in search_keyword.lower():
+                search_keyword = f"{search_keyword} -shutterstock"
+
+            # フォールバック検索（2回目以降）
+            if attempt > 0:
+                print(f"[FALLBACK] Attempt {attempt + 1}: {search_keyword}")
+            else:
+                print(f"Searching Bing images for: {search_keyword} (attempt {attempt + 1}/{max_retries})")
+            
+            return await _search_bing_images_in_browser(browser, keyword, search_keyword, max_results, cache_key)
             
         except Exception as e:
             error_msg = str(e).lower()
             if any(code in error_msg for code in ['timeout', 'connection', 'network']):
                 if attempt < max_retries - 1:
                     print(f"[RETRY] Network error, retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)  # 並列検索中に他のキーワードを止めない
                     continue
                 else:
                     print(f"[ERROR] Max retries reached for '{keyword}'")
@@ -2297,6 +2631,47 @@ async def search_images_with_playwright(keyword: str, max_results: int = 10) ->
     return []
 
 
+
+async def search_images_for_keywords(keywords: List[str], max_results: int = 10) -> Dict[str, List[Dict[str, str]]]:
+    """Chromiumを1回だけ起動し、全キーワードの画像検索をキーワード毎のコンテキストで並列実行（同時数はIMAGE_SEARCH_CONCURRENCYまで）"""
+    import asyncio
+
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("[ERROR] Playwright not available")
+        return {keyword: [] for keyword in keywords}
+
+    unique_keywords = list(dict.fromkeys(keywords))
+    print(f"[SEARCH] Searching {len(unique_keywords)} keywords in parallel with a shared browser (concurrency={IMAGE_SEARCH_CONCURRENCY})")
+    # セマフォはキーワード順に取得されるので、使用済みURLの登録順もおおむねキーワード順に保たれる
+    semaphore = asyncio.Semaphore(IMAGE_SEARCH_CONCURRENCY)
+
+    async def search_with_limit(keyword: str):
+        async with semaphore:
+            return await search_images_with_playwright(keyword, max_results=max_results, browser=browser)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=True,
+            args=[]
+        )
+        try:
+            results = await asyncio.gather(
+                *[search_with_limit(keyword) for keyword in unique_keywords],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
+
+    search_results = {}
+    for keyword, result in zip(unique_keywords, results):
+        if isinstance(result, BaseException):
+            print(f"[ERROR] Image search failed for '{keyword}': {result}")
+            result = []
+        search_results[keyword] = result
+    return search_results
+
 def get_youtube_credentials_from_env():
     """環境変数からYouTube OAuth認証情報を取得（YOUTUBE_CLIENT_SECRETS_JSON使用）"""
     try:
@@ -2405,6 +2780,43 @@ def build_youtube_client_from_env():
         raise
 
 
+# フォールバック用キーワード抽出パターン（カタカナ語3文字以上・英単語3文字以上・漢字2文字以上）
+# 文字種が互いに重ならないので、1回の走査で種類別に振り分けても個別にfindallした結果と一致する
+TEXT_KEYWORD_PATTERN = re.compile(r'(?P<katakana>[ァ-ヶー]{3,})|(?P<english>[A-Za-z]{3,})|(?P<kanji>[\u4e00-\u9faf]{2,})')
+
+
+def _extract_text_keywords(all_text: str, limit: int = None) -> List[str]:
+    """
+    台本テキストから重複のないキーワード候補を抽出（カタカナ→英単語→漢字→空白区切りの語の順）
+    候補を集めてから重複除去するのではなく、追加時にseenで弾いて1パスで済ませる。
+    limitを指定した場合は先頭limit個が確定した時点で走査を打ち切る。
+    """
+    buckets = {"katakana": [], "english": [], "kanji": []}
+    seen = set()
+    for match in TEXT_KEYWORD_PATTERN.finditer(all_text):
+        word = match.group()
+        if word in seen:
+            continue
+        seen.add(word)
+        buckets[match.lastgroup].append(word)
+        # カタカナ語が先頭に来るので、limit個揃えば以降の走査結果は順位に影響しない
+        if limit is not None and len(buckets["katakana"]) >= limit:
+            return buckets["katakana"]
+    
+    unique_keywords = buckets["katakana"] + buckets["english"] + buckets["kanji"]
+    if limit is not None and len(unique_keywords) >= limit:
+        return unique_keywords[:limit]
+    
+    # 一般的な日本語名詞（3文字以上）を抽出
+    for word in all_text.split():
+        if len(word) >= 3 and word.isalpha() and word not in seen:
+            seen.add(word)
+            unique_keywords.append(word)
+            if limit is not None and len(unique_keywords) >= limit:
+                break
+    return unique_keywords
+
+
 def extract_image_keywords_list(script_data: Dict[str, Any]) -> List[str]:
     """台本から画像検索キーワードリストを抽出（LLMキーワードを優先）"""
     try:
@@ -2429,33 +2841,10 @@ def extract_image_keywords_list(script_data: Dict[str, Any]) -> List[str]:
         
         # LLMキーワードがない場合はテキストから動的に抽出
         print("[DEBUG] No LLM keywords available, extracting from text...")
-        import re
-        
-        found_keywords = []
-        
-        # カタカナ語（3文字以上）を抽出
-        katakana_pattern = r'[ァ-ヶー]{3,}'
-        katakana_words = re.findall(katakana_pattern, all_text)
-        found_keywords.extend(katakana_words)
-        
-        # 英単語（3文字以上）を抽出
-        english_pattern = r'[A-Za-z]{3,}'
-        english_words = re.findall(english_pattern, all_text)
-        found_keywords.extend(english_words)
-        
-        # 漢字の連続（2文字以上）を抽出
-        kanji_pattern = r'[\u4e00-\u9faf]{2,}'
-        kanji_words = re.findall(kanji_pattern, all_text)
-        found_keywords.extend(kanji_words)
-        
-        # 一般的な日本語名詞（3文字以上）を抽出
-        japanese_words = [word for word in all_text.split() if len(word) >= 3 and word.isalpha()]
-        found_keywords.extend(japanese_words)
+        unique_keywords = _extract_text_keywords(all_text)
         
-        # 重複を除去してキーワードリストを返す
-        if found_keywords:
-            # 重複除去
-            unique_keywords = list(dict.fromkeys(found_keywords))
+        # 重複除去済みのキーワードリストを返す
+        if unique_keywords:
             print(f"Using extracted keywords: {unique_keywords[:5]}")  # 最初の5つを表示
             return unique_keywords
         else:
@@ -2498,33 +2887,11 @@ def extract_image_keywords_from_script(script_data: Dict[str, Any]) -> str:
         
         # LLMキーワードがない場合はテキストから動的に抽出
         print("[DEBUG] No LLM keywords available, extracting from text...")
-        import re
+        # 使うのは先頭1つ（ログ表示は5つ）なので、5つ確定した時点で抽出を打ち切る
+        unique_keywords = _extract_text_keywords(all_text, limit=5)
         
-        found_keywords = []
-        
-        # カタカナ語（3文字以上）を抽出
-        katakana_pattern = r'[ァ-ヶー]{3,}'
-        katakana_words = re.findall(katakana_pattern, all_text)
-        found_keywords.extend(katakana_words)
-        
-        # 英単語（3文字以上）を抽出
-        english_pattern = r'[A-Za-z]{3,}'
-        english_words = re.findall(english_pattern, all_text)
-        found_keywords.extend(english_words)
-        
-        # 漢字の連続（2文字以上）を抽出
-        kanji_pattern = r'[\u4e00-\u9faf]{2,}'
-        kanji_words = re.findall(kanji_pattern, all_text)
-        found_keywords.extend(kanji_words)
-        
-        # 一般的な日本語名詞（3文字以上）を抽出
-        japanese_words = [word for word in all_text.split() if len(word) >= 3 and word.isalpha()]
-        found_keywords.extend(japanese_words)
-        
-        # 重複を除去して最初のキーワードを使用
-        if found_keywords:
-            # 重複除去
-            unique_keywords = list(dict.fromkeys(found_keywords))
+        # 重複除去済みの最初のキーワードを使用
+        if unique_keywords:
             selected_keyword = unique_keywords[0]
             print(f"Using extracted keyword: {selected_keyword}")
             print(f"[DEBUG] All extracted keywords: {unique_keywords[:5]}")  # 最初の5つを表示
@@ -2596,19 +2963,7 @@ def generate_keywords_with_gemini(text: str, max_keywords: int = 5) -> List[str]
             model='gemini-2.5-flash-lite',
             contents=prompt
         )
-        raw_response = response.text
-        
-        print(f"[DEBUG] Gemini API からの生の返答: {raw_response}")
-        
-        # 生の返答をそのまま使用（洗浄処理を削除）
-        # カンマ区切りで分割してリスト化
-        if isinstance(raw_response, str):
-            keywords = [kw.strip() for kw in raw_response.split(',') if kw.strip()]
-            print(f"[DEBUG] 分割後のキーワード: {keywords}")
-            return keywords
-        else:
-            print(f"[DEBUG] 生の返答が文字列ではありません: {type(raw_response)}")
-            return [str(raw_response)] if raw_response else []
+        return _parse_gemini_keywords(response.text)
         
     except Exception as e:
         print(f"[ERROR] Gemini API call failed: {e}")
@@ -2616,11 +2971,54 @@ def generate_keywords_with_gemini(text: str, max_keywords: int = 5) -> List[str]
         return [text[:10]]  # フォールバック
 
 
-def get_segment_keywords(part_text: str, title: str, topic_summary: str) -> List[str]:
-    keywords = generate_keywords_with_gemini(part_text)
-    if not keywords:
-        raise RuntimeError(f"Failed to generate keywords for segment: {part_text[:50]}...")
-    return keywords
+def _parse_gemini_keywords(raw_response) -> List[str]:
+    """Geminiの返答をカンマ区切りでキーワードリストに変換"""
+    print(f"[DEBUG] Gemini API からの生の返答: {raw_response}")
+    
+    # 生の返答をそのまま使用（洗浄処理を削除）
+    # カンマ区切りで分割してリスト化
+    if isinstance(raw_response, str):
+        keywords = [kw.strip() for kw in raw_response.split(',') if kw.strip()]
+        print(f"[DEBUG] 分割後のキーワード: {keywords}")
+        return keywords
+    else:
+        print(f"[DEBUG] 生の返答が文字列ではありません: {type(raw_response)}")
+        return [str(raw_response)] if raw_response else []
+
+
+async def generate_keywords_with_gemini_async(client, text: str) -> List[str]:
+    """generate_keywords_with_geminiの非同期版（client.aio経由、失敗時は同じフォールバック）"""
+    try:
+        prompt = load_keyword_prompt().format(segment_text=text)
+        print(f"[DEBUG] Gemini API を呼び出します（セグメント内容の冒頭20文字: {text[:20]}...）")
+        response = await client.aio.models.generate_content(
+            model='gemini-2.5-flash-lite',
+            contents=prompt
+        )
+        return _parse_gemini_keywords(response.text)
+    except Exception as e:
+        print(f"[ERROR] Gemini API call failed: {e}")
+        print(f"[ERROR] Exception type: {type(e).__name__}")
+        return [text[:10]]  # フォールバック
+
+
+async def get_segments_keywords_async(part_texts: List[str]) -> List[List[str]]:
+    """複数セグメントのキーワード生成をasyncio.gatherで同時に実行（結果は入力順）"""
+    import asyncio
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        print("[ERROR] GEMINI_API_KEY not found in environment")
+        raise RuntimeError("GEMINI_API_KEY is required for segment keyword generation")
+
+    client = genai.Client(api_key=api_key)
+    results = await asyncio.gather(
+        *[generate_keywords_with_gemini_async(client, part_text) for part_text in part_texts]
+    )
+    for part_text, keywords in zip(part_texts, results):
+        if not keywords:
+            raise RuntimeError(f"Failed to generate keywords for segment: {part_text[:50]}...")
+    return list(results)
 
 
 
@@ -3476,6 +3874,30 @@ def is_safe_domain(image_url: str) -> bool:
     return False
 
 
+# ダウンロード・検証を通過した画像の永続キャッシュ（URLのハッシュをキーに元データを保存）
+# LOCAL_TEMP_DIRは毎回削除されるのでユーザーキャッシュ配下に置く（PERSISTENT_CACHE 有効時のみ使用）
+VIDEO_IMAGE_CACHE_DIR = os.environ.get(
+    "VIDEO_IMAGE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "proset", "video_img"),
+)
+
+
+def _video_image_cache_path(image_url: str) -> str:
+    return os.path.join(VIDEO_IMAGE_CACHE_DIR, hashlib.sha1(image_url.encode("utf-8")).hexdigest())
+
+
+def _store_video_image_cache(cache_path: str, content: bytes) -> None:
+    """書き込み途中のファイルを読まないよう一時ファイル経由で置き換える"""
+    try:
+        os.makedirs(VIDEO_IMAGE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[CACHE] Failed to write image cache {cache_path}: {e}")
+
+
 def download_image_from_url(image_url: str, filename: str = None) -> str:
     """URLから画像をダウンロードしてtempフォルダに保存し、S3にもアップロード（リトライ付き・ゾンビ画像対策）"""
     
@@ -3513,6 +3935,16 @@ def download_image_from_url(image_url: str, filename: str = None) -> str:
             
             local_path = os.path.join(LOCAL_TEMP_DIR, filename)
             
+            # 以前の実行で検証を通過した画像なら、HTTP取得・検証・S3アップロードを省略
+            cache_path = _video_image_cache_path(image_url) if PERSISTENT_CACHE else None
+            if cache_path and os.path.exists(cache_path):
+                try:
+                    shutil.copyfile(cache_path, local_path)
+                    print(f"[CACHE] Image cache hit: {image_url} -> {local_path}")
+                    return local_path
+                except OSError as e:
+                    print(f"[CACHE] Failed to read image cache {cache_path}: {e}")
+            
             print(f"[DEBUG] Downloading image from URL: {image_url} (attempt {attempt + 1}/{max_retries})")
             
             # User-Agentを設定してブロック回避
@@ -3520,7 +3952,7 @@ def download_image_from_url(image_url: str, filename: str = None) -> str:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
             
-            response = requests.get(image_url, timeout=30, headers=headers)
+            response = HTTP_SESSION.get(image_url, timeout=30, headers=headers)
             print(f"[DEBUG] HTTP Status: {response.status_code}")
             print(f"[DEBUG] Content-Type: {response.headers.get('Content-Type', 'Unknown')}")
             print(f"[DEBUG] Content-Length: {response.headers.get('Content-Length', 'Unknown')} bytes")
@@ -3535,65 +3967,53 @@ def download_image_from_url(image_url: str, filename: str = None) -> str:
                 print(f"[REJECT] Byte size too small: {content_size} bytes < 50KB. URL: {image_url}")
                 return None  # ここで即座に抜ける（ファイルを作成しない）
             
-            # 画像をローカルに保存（バリデーション後）
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
-
-            file_size = os.path.getsize(local_path) if os.path.exists(local_path) else 0
-            print(f"[DEBUG] Saved image: path={local_path}, size={file_size} bytes, ext={os.path.splitext(local_path)[1]}")
-            print(f"[DEBUG] Image exists after save: {os.path.exists(local_path)}")
-
-            # Phase 1: 生データのデバッグ保存
-            try:
-                phase1_path = os.path.join(LOCAL_TEMP_DIR, f"debug_1_raw_{filename}")
-                with open(phase1_path, 'wb') as f:
-                    f.write(response.content)
-                print(f"[DEBUG] Saved raw debug image: {phase1_path}")
-            except Exception as e:
-                print(f"[DEBUG] Failed to save raw debug image: {e}")
+            # Phase 1: 生データのデバッグ保存（DEBUG_MODE時のみ）
+            if DEBUG_MODE:
+                try:
+                    phase1_path = os.path.join(LOCAL_TEMP_DIR, f"debug_1_raw_{filename}")
+                    with open(phase1_path, 'wb') as f:
+                        f.write(response.content)
+                    print(f"[DEBUG] Saved raw debug image: {phase1_path}")
+                except Exception as e:
+                    print(f"[DEBUG] Failed to save raw debug image: {e}")
 
             # 画像のフォーマット検証と厳格なフィルタリング
+            # 受信済みのバイト列から直接デコードし、基本検証を通過した画像だけをディスクに書き込む
+            file_size = content_size
             try:
-                with Image.open(local_path) as img:
-                    img.load()  # データ整合性を確認
-                    
-                    # 厳格なフィルタリング条件
+                with Image.open(BytesIO(response.content)) as img:
+                    # 厳格なフィルタリング条件（ヘッダーのみで判定できるためデコード前に確認）
                     width, height = img.size
                     
                     print(f"[DEBUG] Image validation: size={file_size}B, resolution={width}x{height}, format={img.format}")
                     
-                    # 除外条件チェック
-                    if file_size < 50 * 1024:  # 50KB未満
-                        print(f"[REJECT] Image too small: {file_size}B < 50KB")
-                        # 失敗した場合は痕跡（ファイル）を残さない
-                        if os.path.exists(local_path):
-                            os.remove(local_path)
-                            print(f"[DEBUG] Removed invalid file: {local_path}")
-                        return None
-                    
+                    # 除外条件チェック（サイズ50KB未満は受信直後に除外済み）
                     if width < 640 or height < 480:  # 解像度が640x480未満
                         print(f"[REJECT] Resolution too low: {width}x{height} < 640x480")
-                        # 失敗した場合は痕跡（ファイル）を残さない
-                        if os.path.exists(local_path):
-                            os.remove(local_path)
-                            print(f"[DEBUG] Removed invalid file: {local_path}")
-                        return None
-                    
-                    print(f"[PASS] Image validation passed: {width}x{height}, {file_size}B")
-                    
-                    # 物理的フィルタリングを実行
-                    print(f"[FILTER] Running physical image analysis...")
-                    issues = detect_watermark_and_issues(local_path)
+                        return None  # ファイルは作成していない
                     
-                    if issues['rejected']:
-                        print(f"[REJECT] Physical filtering failed: {issues['reason']}")
-                        # 失敗した場合は痕跡（ファイル）を残さない
-                        if os.path.exists(local_path):
-                            os.remove(local_path)
-                            print(f"[DEBUG] Removed filtered file: {local_path}")
-                        return None
-                    
-                    print(f"[PASS] Physical filtering passed: watermark={issues['has_watermark']}, text_ratio={issues['text_ratio']:.1%}, people={issues['has_people']}, screenshot={issues['is_screenshot']}")
+                    img.load()  # 解像度条件を満たした画像のみフルデコードしてデータ整合性を確認
+                
+                print(f"[PASS] Image validation passed: {width}x{height}, {file_size}B")
+                
+                # 画像をローカルに保存（バリデーション後）
+                with open(local_path, 'wb') as f:
+                    f.write(response.content)
+                print(f"[DEBUG] Saved image: path={local_path}, size={file_size} bytes, ext={os.path.splitext(local_path)[1]}")
+                
+                # 物理的フィルタリングを実行
+                print(f"[FILTER] Running physical image analysis...")
+                issues = detect_watermark_and_issues(local_path)
+                
+                if issues['rejected']:
+                    print(f"[REJECT] Physical filtering failed: {issues['reason']}")
+                    # 失敗した場合は痕跡（ファイル）を残さない
+                    if os.path.exists(local_path):
+                        os.remove(local_path)
+                        print(f"[DEBUG] Removed filtered file: {local_path}")
+                    return None
+                
+                print(f"[PASS] Physical filtering passed: watermark={issues['has_watermark']}, text_ratio={issues['text_ratio']:.1%}, people={issues['has_people']}, screenshot={issues['is_screenshot']}")
                     
             except Exception as e:
                 print(f"[DEBUG] Image validation failed: {e}")
@@ -3603,21 +4023,20 @@ def download_image_from_url(image_url: str, filename: str = None) -> str:
                     print(f"[DEBUG] Removed corrupted file: {local_path}")
                 return None
             
-            # S3のtempフォルダにもアップロード
-            try:
-                s3_key = f"temp/{filename}"
-                s3_client.upload_file(local_path, S3_BUCKET, s3_key)
-                print(f"Uploaded image to S3: s3://{S3_BUCKET}/{s3_key}")
-            except Exception as e:
-                print(f"Failed to upload image to S3: {e}")
+            # 検証済みの元データをキャッシュ（次回以降の実行で再取得しない）
+            if cache_path:
+                _store_video_image_cache(cache_path, response.content)
+            
+            # S3のtempフォルダにもアップロード（バックグラウンド実行）
+            upload_file_to_s3_async(local_path, f"temp/{filename}")
             
             print(f"[SUCCESS] Image downloaded successfully: {local_path}")
             return local_path
             
         except Exception as e:
-            # HTTPエラー（503, 429など）の場合はリトライ
-            error_msg = str(e).lower()
-            if any(code in error_msg for code in ['503', '429', 'timeout', 'connection']):
+            # 503/429等のステータスはHTTP_SESSIONのRetryで再試行済み（使い切るとRetryErrorになる）なので、
+            # ここではタイムアウト・接続エラーのみ例外の型で判定してリトライ
+            if isinstance(e, (requests.Timeout, requests.ConnectionError)):
                 if attempt < max_retries - 1:
                     print(f"[RETRY] HTTP error detected, retrying in {retry_delay} seconds...")
                     time.sleep(retry_delay)
@@ -3738,127 +4157,156 @@ async def get_ai_selected_image(script_data: Dict[str, Any]) -> List[str]:
         max_total_images = 15  # 合計上限枚数
         found_suitable_images = []
         
-        for i, keyword in enumerate(keywords):
-            print(f"[IMAGE SEARCH] === Keyword {i+1}/{len(keywords)}: '{keyword}' ===")
+        # 全キーワードの検索はブラウザ1つを共有して先に並列実行しておく（取得数を調整 10→16）
+        search_results = await search_images_for_keywords(keywords, max_results=16)
+
+        # Gemini評価はキーワード間で独立しているので、フィルタ済みになった順にスレッドで並行実行し、
+        # ダウンロードはキーワード順に結果を待ちながら進める（上限に達したら未着手の評価は取り消す）
+        script_text = script_data.get("content", {}).get("topic_summary", "")
+        import asyncio
+        evaluation_pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(IMAGE_EVAL_WORKERS, len(keywords)))
+        evaluation_futures = {}
+        try:
+            for i, keyword in enumerate(keywords):
+                print(f"[IMAGE SEARCH] === Keyword {i+1}/{len(keywords)}: '{keyword}' ===")
             
-            try:
-                # 画像検索実行（取得数を調整）
-                print(f"[IMAGE SEARCH] Searching images for keyword: '{keyword}'")
-                images = await search_images_with_playwright(keyword, max_results=16)  # 10→16に調整
+                try:
+                    # 画像検索結果（並列検索済み）
+                    print(f"[IMAGE SEARCH] Searching images for keyword: '{keyword}'")
+                    images = search_results.get(keyword, [])
                 
-                if not images:
-                    print(f"[IMAGE SEARCH] No images found for keyword: '{keyword}'")
-                    continue
+                    if not images:
+                        print(f"[IMAGE SEARCH] No images found for keyword: '{keyword}'")
+                        continue
                 
-                total_images_found += len(images)
-                print(f"[IMAGE SEARCH] Found {len(images)} raw images for '{keyword}'")
+                    total_images_found += len(images)
+                    print(f"[IMAGE SEARCH] Found {len(images)} raw images for '{keyword}'")
                 
-                # 取得前フィルタリングを実行
-                pre_filtered_images = []
-                pre_blocked_count = 0
+                    # 取得前フィルタリングを実行
+                    pre_filtered_images = []
+                    pre_blocked_count = 0
                 
-                for image_info in images:
-                    pre_filter_result = pre_filter_image_metadata(image_info)
-                    if not pre_filter_result['suitable']:
-                        pre_blocked_count += 1
-                        print(f"[PRE-FILTER] BLOCK: {image_info.get('title', 'N/A')} ({pre_filter_result['reason']})")
-                    else:
-                        pre_filtered_images.append(image_info)
+                    for image_info in images:
+                        pre_filter_result = pre_filter_image_metadata(image_info)
+                        if not pre_filter_result['suitable']:
+                            pre_blocked_count += 1
+                            print(f"[PRE-FILTER] BLOCK: {image_info.get('title', 'N/A')} ({pre_filter_result['reason']})")
+                        else:
+                            pre_filtered_images.append(image_info)
                 
-                total_blocked += pre_blocked_count
-                print(f"[PRE-FILTER] Filtered {pre_blocked_count} high-risk images, {len(pre_filtered_images)} remaining")
+                    total_blocked += pre_blocked_count
+                    print(f"[PRE-FILTER] Filtered {pre_blocked_count} high-risk images, {len(pre_filtered_images)} remaining")
                 
-                if not pre_filtered_images:
-                    print(f"[IMAGE SEARCH] No unblocked images for keyword '{keyword}'")
-                    continue
+                    if not pre_filtered_images:
+                        print(f"[IMAGE SEARCH] No unblocked images for keyword '{keyword}'")
+                        continue
                 
-                # 安全ドメインと通常ドメインに分類
-                safe_images = []
-                normal_images = []
+                    # 安全ドメインと通常ドメインに分類
+                    safe_images = []
+                    normal_images = []
                 
-                for image_info in pre_filtered_images:
-                    if is_safe_domain(image_info['url']):
-                        safe_images.append(image_info)
-                    else:
-                        normal_images.append(image_info)
+                    for image_info in pre_filtered_images:
+                        if is_safe_domain(image_info['url']):
+                            safe_images.append(image_info)
+                        else:
+                            normal_images.append(image_info)
                 
-                # 戦略的選択：安全ドメインを優先
-                filtered_images = []
-                if len(safe_images) >= 3:
-                    filtered_images = safe_images
-                    print(f"[IMAGE STRATEGY] Using only safe domains ({len(safe_images)} images)")
-                # 安全な画像が少ない場合は通常ドメインも含める
-                elif len(safe_images) + len(normal_images) >= 3:
-                    filtered_images = safe_images + normal_images
+                    # 戦略的選択：安全ドメインを優先
+                    filtered_images = []
+                    if len(safe_images) >= 3:
+                        filtered_images = safe_images
+                        print(f"[IMAGE STRATEGY] Using only safe domains ({len(safe_images)} images)")
+                    # 安全な画像が少ない場合は通常ドメインも含める
+                    elif len(safe_images) + len(normal_images) >= 3:
+                        filtered_images = safe_images + normal_images
                 
-                if not filtered_images:
-                    print(f"[IMAGE SEARCH] No unblocked images for keyword '{keyword}'")
-                    continue
+                    if not filtered_images:
+                        print(f"[IMAGE SEARCH] No unblocked images for keyword '{keyword}'")
+                        continue
                 
-                # Geminiで一括評価（評価対象を調整）
-                print(f"[IMAGE EVAL] Starting Gemini evaluation for {min(30, len(filtered_images))} images")
-                print(f"[IMAGE EVAL] GEMINI_API_KEY check: {'✓ Present' if os.environ.get('GEMINI_API_KEY') else '✗ Missing'}")
-                script_text = script_data.get("content", {}).get("topic_summary", "")
-                print(f"[IMAGE EVAL] Script text length: {len(script_text)} chars")
-                print(f"[IMAGE EVAL] Keyword: '{keyword}'")
+                    # Geminiで一括評価（評価対象を調整）
+                    print(f"[IMAGE EVAL] Starting Gemini evaluation for {min(30, len(filtered_images))} images")
+                    print(f"[IMAGE EVAL] GEMINI_API_KEY check: {'✓ Present' if os.environ.get('GEMINI_API_KEY') else '✗ Missing'}")
+                    print(f"[IMAGE EVAL] Script text length: {len(script_text)} chars")
+                    print(f"[IMAGE EVAL] Keyword: '{keyword}'")
                 
-                suitable_images = evaluate_images_batch_with_gemini_improved(filtered_images[:30], keyword, script_text)  # 改善版を使用
+                    evaluation_futures[i] = evaluation_pool.submit(
+                        evaluate_images_batch_with_gemini_improved, filtered_images[:30], keyword, script_text  # 改善版を使用
+                    )
                 
-                print(f"[IMAGE EVAL] Gemini evaluation completed. Result: {len(suitable_images)} suitable images")
+                except Exception as e:
+                    print(f"[IMAGE ERROR] Error processing keyword '{keyword}': {type(e).__name__}: {e}")
+                    import traceback
+                    print(f"[IMAGE ERROR] Traceback: {traceback.format_exc()}")
+                    continue
+
+            for i, keyword in enumerate(keywords):
+                if i not in evaluation_futures:
+                    continue
+            
+                try:
+                    suitable_images = await asyncio.wrap_future(evaluation_futures[i])
                 
-                if not suitable_images:
-                    print(f"[IMAGE EVAL] No suitable images approved by Gemini for '{keyword}'")
-                    continue  # 次のキーワードを試行
+                    print(f"[IMAGE EVAL] Gemini evaluation completed for '{keyword}'. Result: {len(suitable_images)} suitable images")
                 
-                print(f"[IMAGE EVAL] Gemini approved {len(suitable_images)} images")
+                    if not suitable_images:
+                        print(f"[IMAGE EVAL] No suitable images approved by Gemini for '{keyword}'")
+                        continue  # 次のキーワードを試行
                 
-                # 適切な画像のダウンロードを試行（各キーワード5枚、合計15枚まで）
-                keyword_images_found = 0
-                for j, selected_image in enumerate(suitable_images):
-                    # 合計上限チェック
-                    if len(found_suitable_images) >= max_total_images:
-                        print(f"[IMAGE SUCCESS] Reached total limit of {max_total_images} images")
-                        break
+                    print(f"[IMAGE EVAL] Gemini approved {len(suitable_images)} images")
+                
+                    # 適切な画像のダウンロードを試行（各キーワード5枚、合計15枚まで）
+                    # 残り必要枚数分の候補だけを同時にダウンロードし、結果は候補順に採用する（上限を超えて取得しない）
+                    keyword_images_found = 0
+                    next_index = 0
+                    while next_index < len(suitable_images):
+                        # 合計上限チェック
+                        if len(found_suitable_images) >= max_total_images:
+                            print(f"[IMAGE SUCCESS] Reached total limit of {max_total_images} images")
+                            break
                     
-                    # キーワードあたりの上限チェック
-                    if keyword_images_found >= images_per_keyword:
-                        print(f"[IMAGE SUCCESS] Reached keyword limit of {images_per_keyword} images for '{keyword}'")
-                        break
+                        # キーワードあたりの上限チェック
+                        if keyword_images_found >= images_per_keyword:
+                            print(f"[IMAGE SUCCESS] Reached keyword limit of {images_per_keyword} images for '{keyword}'")
+                            break
                     
-                    print(f"[IMAGE DOWNLOAD] Attempting download {j+1}/{len(suitable_images)}: {selected_image.get('title', 'N/A')}")
+                        needed = min(images_per_keyword - keyword_images_found, max_total_images - len(found_suitable_images))
+                        batch = [(j, suitable_images[j]) for j in range(next_index, min(next_index + needed, len(suitable_images)))]
+                        next_index += len(batch)
+                        for j, selected_image in batch:
+                            print(f"[IMAGE DOWNLOAD] Attempting download {j+1}/{len(suitable_images)}: {selected_image.get('title', 'N/A')}")
                     
-                    image_path = download_image_from_url(selected_image['url'])
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=min(IMAGE_DOWNLOAD_WORKERS, len(batch))) as executor:
+                            image_paths = list(executor.map(lambda item: download_image_from_url(item[1]['url']), batch))
                     
-                    if image_path:
-                        print(f"[IMAGE SUCCESS] Successfully downloaded and validated: {selected_image.get('title', 'N/A')}")
-                        found_suitable_images.append({
-                            'path': image_path,
-                            'title': selected_image.get('title', 'N/A'),
-                            'url': selected_image['url']
-                        })
-                        keyword_images_found += 1
-                        
-                        # 合計上限に達したら終了
-                        if len(found_suitable_images) >= max_total_images:
-                            print(f"[IMAGE SUCCESS] Reached total limit of {max_total_images} images")
-                            break
-                    else:
-                        download_failures += 1
-                        print(f"[IMAGE DOWNLOAD] Failed to download image {j+1}, trying next suitable image")
-                        continue
+                        for (j, selected_image), image_path in zip(batch, image_paths):
+                            if image_path:
+                                print(f"[IMAGE SUCCESS] Successfully downloaded and validated: {selected_image.get('title', 'N/A')}")
+                                found_suitable_images.append({
+                                    'path': image_path,
+                                    'title': selected_image.get('title', 'N/A'),
+                                    'url': selected_image['url']
+                                })
+                                keyword_images_found += 1
+                            else:
+                                download_failures += 1
+                                print(f"[IMAGE DOWNLOAD] Failed to download image {j+1}, trying next suitable image")
                 
-                print(f"[IMAGE SEARCH] Found {len(found_suitable_images)} suitable images so far (keyword '{keyword}': {keyword_images_found} images)")
+                    print(f"[IMAGE SEARCH] Found {len(found_suitable_images)} suitable images so far (keyword '{keyword}': {keyword_images_found} images)")
                 
-                # 合計上限に達したら全キーワード検索を終了
-                if len(found_suitable_images) >= max_total_images:
-                    print(f"[IMAGE SUCCESS] Reached total limit of {max_total_images} images across all keywords")
-                    break
+                    # 合計上限に達したら全キーワード検索を終了
+                    if len(found_suitable_images) >= max_total_images:
+                        print(f"[IMAGE SUCCESS] Reached total limit of {max_total_images} images across all keywords")
+                        break
                 
-            except Exception as e:
-                print(f"[IMAGE ERROR] Error processing keyword '{keyword}': {type(e).__name__}: {e}")
-                import traceback
-                print(f"[IMAGE ERROR] Traceback: {traceback.format_exc()}")
-                continue
+                except Exception as e:
+                    print(f"[IMAGE ERROR] Error processing keyword '{keyword}': {type(e).__name__}: {e}")
+                    import traceback
+                    print(f"[IMAGE ERROR] Traceback: {traceback.format_exc()}")
+                    continue
+        finally:
+            # 上限到達や例外で抜けた場合も未着手の評価を取り消してスレッドを解放する
+            evaluation_pool.shutdown(wait=False, cancel_futures=True)
         
         # 規定枚数に達したか確認
         if found_suitable_images:
@@ -3920,30 +4368,21 @@ def create_gradient_background(width: int, height: int) -> np.ndarray:
     navy_color = np.array([10, 25, 47])  # 濃いネイビー
     black_color = np.array([0, 0, 0])     # 黒
     
-    # 垂直グラデーション（上から下へ）
-    gradient = np.zeros((height, width, 3), dtype=np.uint8)
-    for y in range(height):
-        ratio = y / height
-        color = navy_color * (1 - ratio) + black_color * ratio
-        gradient[y, :] = color.astype(np.uint8)
-    
-    return gradient
+    # 垂直グラデーション（上から下へ）：行ごとの色を一括計算して横方向へブロードキャスト
+    ratio = (np.arange(height) / height).reshape(height, 1, 1)
+    row_colors = (navy_color * (1 - ratio) + black_color * ratio).astype(np.uint8)
+    return np.broadcast_to(row_colors, (height, width, 3)).copy()
 
 
 def create_breathing_effect(duration: float) -> List[float]:
     """呼吸アニメーション（97%〜100%）のスケール値リストを生成"""
-    import math
     fps = 30
     frames = int(duration * fps)
-    scales = []
     
-    for i in range(frames):
-        # 4秒周期で呼吸アニメーション
-        t = (i / fps) % 4.0
-        scale = 0.97 + 0.03 * (0.5 + 0.5 * math.sin(2 * math.pi * t / 4.0))
-        scales.append(scale)
-    
-    return scales
+    # 4秒周期で呼吸アニメーション（全フレーム分を一括計算）
+    t = (np.arange(frames) / fps) % 4.0
+    scales = 0.97 + 0.03 * (0.5 + 0.5 * np.sin(2 * np.pi * t / 4.0))
+    return scales.tolist()
 
 
 def build_youtube_client():
@@ -4099,6 +4538,11 @@ def sanitize_script_text(text: str) -> str:
     return text
 
 
+# テキスト分割パターン（分割記号を結果に残すためキャプチャ付き）
+SENTENCE_SPLIT_PATTERN = re.compile(r'([。！？])')
+SPACE_SPLIT_PATTERN = re.compile(r'([\s　])')
+
+
 def split_text_unified(text: str, max_chars: int = 120, merge_small_chunks: bool = False, merge_threshold: int = 150) -> List[str]:
     """
     テキスト分割の統一ロジック - 音声合成と字幕生成の両方に使用
@@ -4119,10 +4563,8 @@ def split_text_unified(text: str, max_chars: int = 120, merge_small_chunks: bool
     if len(text) <= max_chars:
         return [text.strip()]
 
-    import re
-
     # 句読点で分割（。！？）
-    parts = re.split(r'([。！？])', text)
+    parts = SENTENCE_SPLIT_PATTERN.split(text)
 
     # 分割記号を元に戻す
     chunks = []
@@ -4141,36 +4583,45 @@ def split_text_unified(text: str, max_chars: int = 120, merge_small_chunks: bool
             result.append(chunk)
         else:
             # スペースで分割
-            words = re.split(r'([\s　])', chunk)
-            temp = ""
+            words = SPACE_SPLIT_PATTERN.split(chunk)
+            buf: List[str] = []
+            buf_len = 0
             for word in words:
-                if len(temp + word) <= max_chars:
-                    temp += word
+                if buf_len + len(word) <= max_chars:
+                    buf.append(word)
+                    buf_len += len(word)
                 else:
-                    if temp.strip():
-                        result.append(temp.strip())
-                    temp = word
-            if temp.strip():
-                result.append(temp.strip())
+                    temp = "".join(buf).strip()
+                    if temp:
+                        result.append(temp)
+                    buf = [word]
+                    buf_len = len(word)
+            temp = "".join(buf).strip()
+            if temp:
+                result.append(temp)
 
     # merge_small_chunks有効時：小さいチャンク（merge_threshold未満）を結合
     if merge_small_chunks:
         merged = []
-        current = ""
+        current: List[str] = []
+        current_len = 0
         for chunk in result:
             # 現在のバッファ+新しいチャンク を結合できるか判定
-            if len(current) == 0:
-                current = chunk
-            elif len(current + chunk) <= merge_threshold:
+            if current_len == 0:
+                current = [chunk]
+                current_len = len(chunk)
+            elif current_len + len(chunk) <= merge_threshold:
                 # 結合可能：繋げる
-                current += chunk
+                current.append(chunk)
+                current_len += len(chunk)
             else:
                 # 結合不可：現在のバッファを確定、新しいチャンクを開始
-                merged.append(current)
-                current = chunk
+                merged.append("".join(current))
+                current = [chunk]
+                current_len = len(chunk)
 
-        if current:
-            merged.append(current)
+        if current_len:
+            merged.append("".join(current))
 
         return merged
 
@@ -4252,7 +4703,7 @@ def synthesize_speech_voicevox(text: str, speaker_id: int, out_path: str) -> tup
                         "text": part_text,
                         "speaker": speaker_id
                     }
-                    query_resp = requests.post(query_url, params=query_params, timeout=30)
+                    query_resp = HTTP_SESSION.post(query_url, params=query_params, timeout=30)
                     if query_resp.status_code != 200:
                         raise RuntimeError(f"VOICEVOX クエリ生成失敗: {query_resp.status_code} {query_resp.text}")
                     
@@ -4269,24 +4720,27 @@ def synthesize_speech_voicevox(text: str, speaker_id: int, out_path: str) -> tup
                         print(f"Critical error: Audio query failed for part {i}. Error: {str(e)}")
                         raise RuntimeError(f"Failed to generate audio query for part {i}: {str(e)}")
             
-            # 音声合成のリトライロジック
-            synthesis_content = None
+            # 音声合成のリトライロジック（レスポンスを一時音声ファイルへ直接ストリーム書き込み）
+            temp_audio_path = os.path.join(temp_dir, f"temp_audio_{i}.wav")
             for attempt in range(1, 4):  # 最大3回リトライ
                 try:
                     print(f"Synthesizing audio for part {i}, attempt {attempt}/3")
                     synthesis_url = f"{VOICEVOX_API_URL}/synthesis"
                     synthesis_params = {"speaker": speaker_id}
-                    synthesis_resp = requests.post(
+                    with HTTP_SESSION.post(
                         synthesis_url,
                         params=synthesis_params,
                         json=query_data,
                         timeout=60,
-                        headers={"Content-Type": "application/json"}
-                    )
-                    if synthesis_resp.status_code != 200:
-                        raise RuntimeError(f"VOICEVOX 音声合成失敗: {synthesis_resp.status_code} {synthesis_resp.text}")
-                    
-                    synthesis_content = synthesis_resp.content
+                        headers={"Content-Type": "application/json"},
+                        stream=True,
+                    ) as synthesis_resp:
+                        if synthesis_resp.status_code != 200:
+                            raise RuntimeError(f"VOICEVOX 音声合成失敗: {synthesis_resp.status_code} {synthesis_resp.text}")
+
+                        with open(temp_audio_path, "wb") as out_f:
+                            for chunk in synthesis_resp.iter_content(chunk_size=65536):
+                                out_f.write(chunk)
                     print(f"Audio synthesis successful for part {i}")
                     break  # 成功したらループを抜ける
                     
@@ -4298,11 +4752,6 @@ def synthesize_speech_voicevox(text: str, speaker_id: int, out_path: str) -> tup
                         print(f"Critical error: Audio synthesis failed for part {i}. Error: {str(e)}")
                         raise RuntimeError(f"Failed to synthesize audio for part {i}: {str(e)}")
             
-            # 一時音声ファイルとして保存
-            temp_audio_path = os.path.join(temp_dir, f"temp_audio_{i}.wav")
-            with open(temp_audio_path, "wb") as out_f:
-                out_f.write(synthesis_content)
-            
             clip = AudioFileClip(temp_audio_path)
             audio_clips.append(clip)
         
@@ -4379,7 +4828,7 @@ def synthesize_precut_speech_voicevox(text_parts: List[str], speaker_id: int, ou
                         "text": part_text,
                         "speaker": speaker_id
                     }
-                    query_resp = requests.post(query_url, params=query_params, timeout=30)
+                    query_resp = HTTP_SESSION.post(query_url, params=query_params, timeout=30)
                     if query_resp.status_code != 200:
                         raise RuntimeError(f"Query generation failed: {query_resp.status_code}")
 
@@ -4393,23 +4842,26 @@ def synthesize_precut_speech_voicevox(text_parts: List[str], speaker_id: int, ou
                     else:
                         raise RuntimeError(f"Failed query generation for part {i}: {str(e)}")
 
-            # 音声合成のリトライロジック
-            synthesis_content = None
+            # 音声合成のリトライロジック（レスポンスを一時音声ファイルへ直接ストリーム書き込み）
+            temp_audio_path = os.path.join(temp_dir, f"temp_audio_{i}.wav")
             for attempt in range(1, 4):  # 最大3回リトライ
                 try:
                     synthesis_url = f"{VOICEVOX_API_URL}/synthesis"
                     synthesis_params = {"speaker": speaker_id}
-                    synthesis_resp = requests.post(
+                    with HTTP_SESSION.post(
                         synthesis_url,
                         params=synthesis_params,
                         json=query_data,
                         timeout=60,
-                        headers={"Content-Type": "application/json"}
-                    )
-                    if synthesis_resp.status_code != 200:
-                        raise RuntimeError(f"Synthesis failed: {synthesis_resp.status_code}")
-
-                    synthesis_content = synthesis_resp.content
+                        headers={"Content-Type": "application/json"},
+                        stream=True,
+                    ) as synthesis_resp:
+                        if synthesis_resp.status_code != 200:
+                            raise RuntimeError(f"Synthesis failed: {synthesis_resp.status_code}")
+
+                        with open(temp_audio_path, "wb") as out_f:
+                            for chunk in synthesis_resp.iter_content(chunk_size=65536):
+                                out_f.write(chunk)
                     break  # 成功
 
                 except Exception as e:
@@ -4419,11 +4871,6 @@ def synthesize_precut_speech_voicevox(text_parts: List[str], speaker_id: int, ou
                     else:
                         raise RuntimeError(f"Failed synthesis for part {i}: {str(e)}")
 
-            # 一時音声ファイルとして保存
-            temp_audio_path = os.path.join(temp_dir, f"temp_audio_{i}.wav")
-            with open(temp_audio_path, "wb") as out_f:
-                out_f.write(synthesis_content)
-
             # 【重要】実ファイルのdurationを取得
             clip = AudioFileClip(temp_audio_path)
             file_duration = clip.duration
@@ -4474,26 +4921,16 @@ def synthesize_multiple_speeches(script_parts: List[Dict[str, Any]], tmpdir: str
     successful_parts = 0
     failed_parts = []
 
-    print(f"Processing {len(script_parts)} script parts...")
-    
-    for i, part in enumerate(script_parts):
+    def _synth_one(i: int, part: Dict[str, Any]):
+        """1パーツ分の音声合成（リトライ付き）。失敗・空テキスト時は None を返す"""
         part_name = part.get("part", "")
         text = sanitize_script_text(part.get("text", ""))
-        
-        # ★空テキストの場合は0.0を記録してスキップ（インデックス維持）
+
+        # ★空テキストの場合は None を返してスキップ（インデックスは呼び出し側で維持）
         if not text:
             print(f"[REORDER] Part {i} ({part_name}): Empty text, recording 0.0 duration")
-            part_durations.append(0.0)
-            query_data_list_all[i] = []
-            text_parts_list_all[i] = []
-            duration_list_all[i] = []
-            continue
-        
-        # 音声生成処理（リトライ付き）
-        clip = None
-        part_duration = 0.0
-        success = False
-        
+            return i, None
+
         for attempt in range(1, 4):
             try:
                 # part名に応じてspeaker_idを決定
@@ -4505,7 +4942,7 @@ def synthesize_multiple_speeches(script_parts: List[Dict[str, Any]], tmpdir: str
                         speaker_id = random.choice([2, 8, 10, 12, 13, 14])
                 else:
                     speaker_id = part.get("speaker_id", 3)
-                
+
                 audio_path = os.path.join(tmpdir, f"audio_{i}.wav")
 
                 # テキストを字幕チャンク単位で分割
@@ -4523,52 +4960,51 @@ def synthesize_multiple_speeches(script_parts: List[Dict[str, Any]], tmpdir: str
                     subtitle_text_parts, speaker_id, audio_path
                 )
 
-                if os.path.exists(audio_path):
-                    audio_clip = AudioFileClip(audio_path)
-                    actual_duration = audio_clip.duration
-                    
-                    # ★成功時のデータ記録
-                    audio_clips.append(audio_clip)
-                    generated_audio_files.append(audio_path)
-                    part_durations.append(actual_duration)
-                    query_data_list_all[i] = query_data_list
-                    text_parts_list_all[i] = text_parts_from_synthesis
-                    duration_list_all[i] = duration_list
-                    
-                    print(f"[REORDER] Part {i} ({part_name}): SUCCESS duration={actual_duration:.2f}s, chunks={len(text_parts_from_synthesis)}")
-                    successful_parts += 1
-                    success = True
-                    break
-                else:
+                if not os.path.exists(audio_path):
                     raise RuntimeError(f"Audio file not created for part {i}")
-                    
+
+                audio_clip = AudioFileClip(audio_path)
+                print(f"[REORDER] Part {i} ({part_name}): SUCCESS duration={audio_clip.duration:.2f}s, chunks={len(text_parts_from_synthesis)}")
+                return i, (audio_clip, audio_path, query_data_list, text_parts_from_synthesis, duration_list)
+
             except Exception as e:
                 if attempt < 3:
                     print(f"[REORDER] Part {i} ({part_name}): Attempt {attempt} failed, retrying... Error: {str(e)}")
                     time.sleep(2)
-                    if clip:
-                        try:
-                            clip.close()
-                        except:
-                            pass
-                    clip = None
                 else:
                     print(f"[ERROR] Part {i} ({part_name}): All 3 attempts failed. Error: {str(e)}")
                     failed_parts.append(i)
-                    if clip:
-                        try:
-                            clip.close()
-                        except:
-                            pass
-        
-        # ★失敗時も0.0を記録（インデックス維持）
-        if not success:
-            print(f"[REORDER] Part {i} ({part_name}): FAILED - Recording 0.0 duration")
+
+        return i, None
+
+    print(f"Processing {len(script_parts)} script parts (workers={VOICEVOX_WORKERS})...")
+
+    # パーツ単位で並列合成（VOICEVOXの待ち時間を重ねる）
+    with concurrent.futures.ThreadPoolExecutor(max_workers=VOICEVOX_WORKERS) as executor:
+        results = list(executor.map(lambda ip: _synth_one(*ip), enumerate(script_parts)))
+
+    # ★script_partsの順序どおりに結果を組み立てる（インデックス維持）
+    for i, result in sorted(results, key=lambda r: r[0]):
+        if result is None:
+            if i in failed_parts:
+                print(f"[REORDER] Part {i} ({script_parts[i].get('part', '')}): FAILED - Recording 0.0 duration")
             part_durations.append(0.0)
             query_data_list_all[i] = []
             text_parts_list_all[i] = []
             duration_list_all[i] = []
-    
+            continue
+
+        audio_clip, audio_path, query_data_list, text_parts_from_synthesis, duration_list = result
+        # ★成功時のデータ記録
+        audio_clips.append(audio_clip)
+        generated_audio_files.append(audio_path)
+        part_durations.append(audio_clip.duration)
+        query_data_list_all[i] = query_data_list
+        text_parts_list_all[i] = text_parts_from_synthesis
+        duration_list_all[i] = duration_list
+        successful_parts += 1
+    failed_parts.sort()
+
     # 処理結果のサマリー
     print(f"Audio synthesis completed: {successful_parts}/{len(script_parts)} parts successful")
     if failed_parts:
@@ -4659,9 +5095,12 @@ async def build_video_with_subtitles(
         title_video_clip = None
         modulation_video_clip = None
 
+        # S3アセットは互いに独立しているので、最初にまとめて並列ダウンロードしておく
+        s3_assets = prefetch_s3_assets()
+
         # オープニング動画とブリッジ動画の準備
-        title_video_path = download_title_video()
-        modulation_video_path = download_modulation_video()
+        title_video_path = s3_assets["title"]
+        modulation_video_path = s3_assets["modulation"]
         
         # オープニング動画の読み込み
         print("=== TITLE VIDEO DEBUG START ===")
@@ -4720,7 +5159,7 @@ async def build_video_with_subtitles(
 
         # BGMの準備（title_durationとmodulation_durationが確定した後）
         print("=== BGM DEBUG START ===")
-        bgm_path = download_background_music()
+        bgm_path = s3_assets["bgm"]
         print(f"[BGM DEBUG] Downloaded BGM path: {bgm_path}")
         print(f"[BGM DEBUG] BGM path exists: {os.path.exists(bgm_path) if bgm_path else False}")
         
@@ -4781,7 +5220,7 @@ async def build_video_with_subtitles(
         # 画像収集と動画構築の処理を続行...
 
         # Layer 1: 背景動画の準備（インテリジェント・リサイズ）
-        bg_video_path = download_random_background_video()
+        bg_video_path = s3_assets["background"]
         
         if bg_video_path and os.path.exists(bg_video_path):
             print("Using random background video from S3")
@@ -4830,19 +5269,15 @@ async def build_video_with_subtitles(
                     
                     if unique_colors < 10:
                         print("[WARNING] 背景動画が単色またはグレーダミーに差し替わっています！")
-                        print("[ACTION] MoviePy v2.0 仕様に変更します")
-                        
-                        # MoviePy v2.0 仕様で再処理
-                        bg_clip_raw = VideoFileClip(bg_video_path).without_audio()
-                        if DEBUG_MODE:
-                            bg_clip_raw = bg_clip_raw.subclipped(0, 60)
-                        else:
-                            bg_clip_raw = bg_clip_raw.subclipped(0, total_duration)
+                        print("[ACTION] bg_clip を閉じて None に設定し、処理を中断します")
                         
-                        # target_resolution を使用（MoviePy v2.0 仕様）
-                        bg_clip_raw = VideoFileClip(bg_path, audio=False, target_resolution=(1920, 1080))
-                        bg_clip = bg_clip_raw
-                        print("[RECOVERY] target_resolution 方式で再処理しました")
+                        # ループ・長さ調整・音声を持たない生クリップで置き換えると背景が途中で途切れるため、
+                        # 差し替えは行わずに失敗として扱う
+                        try:
+                            bg_clip.close()
+                        except Exception as close_error:
+                            print(f"[WARNING] bg_clip close failed: {close_error}")
+                        bg_clip = None
                     else:
                         print("[PASS] 背景動画は正常な画像配列を保持しています")
                         
@@ -4871,21 +5306,25 @@ async def build_video_with_subtitles(
         print("[IMAGE SEARCH] Using traditional keyword extraction with new filtering")
         
         # 複数の解説パートからキーワードを収集
-        all_keywords = []
-        for i, (part, duration) in enumerate(zip(script_parts, part_durations)):
+        article_part_texts = []
+        for part, duration in zip(script_parts, part_durations):
             if duration <= 0:
                 continue
             part_type = part.get("part", "")
             if not part_type.startswith("article_"):
                 continue
-            
-            part_text = sanitize_script_text(part.get("text", ""))
-            part_keywords = get_segment_keywords(part_text, title, topic_summary)
-            all_keywords.extend(part_keywords)
-            
-            # 十分なキーワードが集まったら終了
+            article_part_texts.append(sanitize_script_text(part.get("text", "")))
+
+        # KEYWORD_BATCH_SIZE件ずつ同時にGeminiへ問い合わせ、十分なキーワードが集まったら終了
+        all_keywords = []
+        for batch_start in range(0, len(article_part_texts), KEYWORD_BATCH_SIZE):
+            batch_texts = article_part_texts[batch_start:batch_start + KEYWORD_BATCH_SIZE]
+            for offset, part_keywords in enumerate(await get_segments_keywords_async(batch_texts)):
+                all_keywords.extend(part_keywords)
+                if len(all_keywords) >= 5:
+                    print(f"[INFO] Collected {len(all_keywords)} keywords from {batch_start + offset + 1} article parts")
+                    break
             if len(all_keywords) >= 5:
-                print(f"[INFO] Collected {len(all_keywords)} keywords from {i+1} parts")
                 break
         
         if not all_keywords:
@@ -5155,8 +5594,7 @@ async def build_video_with_subtitles(
                         with Image.open(image_path) as img:
                             print(f"[DEBUG] Original image size: {img.size}, format: {img.format}, mode: {img.mode}")
 
-                            # RGBに変換
-                            img = img.convert("RGB")
+                            # ヘッダーのサイズから縮小先を決める（画素のデコードはまだ行わない）
                             original_width, original_height = img.size
 
                             # ランダムなサイズ範囲を計算（画面の50-80%に拡大）
@@ -5181,8 +5619,15 @@ async def build_video_with_subtitles(
                                 target_height = min_height
                                 target_width = int(target_height / aspect_ratio)
 
+                            # JPEGはlibjpegのDCT段階で縮小デコード（縮小先を下回らない1/2〜1/8スケール）
+                            if img.format == "JPEG":
+                                img.draft("RGB", (target_width, target_height))
+
+                            # RGBに変換
+                            img = img.convert("RGB")
+
                             # PillowのLANCZOSで高品質リサイズ
-                            if target_width != original_width or target_height != original_height:
+                            if img.size != (target_width, target_height):
                                 print(f"[DEBUG] Resizing with Pillow LANCZOS: {original_width}x{original_height} → {target_width}x{target_height}")
                                 img = img.resize((target_width, target_height), Image.LANCZOS)
 
@@ -5260,7 +5705,7 @@ async def build_video_with_subtitles(
         # Layer 3: 左上ヘッダー画像表示 - 1920x1080用に調整
         heading_clip = None
         try:
-            heading_path = download_heading_image()
+            heading_path = s3_assets["heading"]
             if heading_path and os.path.exists(heading_path):
                 # ヘッダー画像を読み込んでImageClipとして配置
                 heading_img = ImageClip(heading_path)
@@ -5436,9 +5881,10 @@ async def build_video_with_subtitles(
         
         bitrate = "800k" if DEBUG_MODE else VIDEO_BITRATE
         
-        # ffmpeg実行コマンドの可視化
-        # DEBUG_MODE時も8Mbpsを強制する
-        ffmpeg_params = ['-crf', '23', '-b:v', '8000k'] if not DEBUG_MODE else ['-crf', '28', '-preset', 'ultrafast', '-b:v', '8000k']
+        # エンコーダ選択（NVENC/QSVが使えればハードウェアエンコード）
+        video_codec = select_video_codec()
+        preset, ffmpeg_params = get_encode_settings(video_codec)
+        print(f"[ENCODER] codec={video_codec}, preset={preset}, ffmpeg_params={ffmpeg_params}")
 
         # asyncio×moviepy相性対策：write_videofileをasyncio.to_threadで実行
         import asyncio
@@ -5446,14 +5892,14 @@ async def build_video_with_subtitles(
             video.write_videofile,
             out_video_path,
             fps=30,  # 30fps固定
-            codec='libx264',
-            preset='medium' if not DEBUG_MODE else 'ultrafast',  # 高画質設定
+            codec=video_codec,
+            preset=preset,  # 高画質設定
             audio_codec='aac',
             audio_bitrate='256k',  # 音声256kbps
             bitrate=bitrate,
             temp_audiofile='temp-audio.m4a',
             remove_temp=True,
-            threads=4,  # 並列処理を抑制（ローカル環境向け）
+            threads=ENCODE_THREADS,
             ffmpeg_params=ffmpeg_params,  # 高画質CRF値と8Mbps強制
             logger=None  # コンソール書き込みを抑制
         )
@@ -5511,7 +5957,11 @@ async def build_video_with_subtitles(
                     pass
         
         # 一時ファイルのクリーンアップ
-        if 'bg_video_path' in locals() and bg_video_path and os.path.exists(bg_video_path):
+        # ETagキャッシュ配下の背景動画は次回以降再利用するので削除しない
+        if (
+            'bg_video_path' in locals() and bg_video_path and os.path.exists(bg_video_path)
+            and os.path.dirname(os.path.abspath(bg_video_path)) != os.path.abspath(BACKGROUND_VIDEO_CACHE_DIR)
+        ):
             try:
                 os.remove(bg_video_path)
                 bg_dir = os.path.dirname(bg_video_path)
@@ -16,6 +16,21 @@ pip install -r requirements.txt
 pip install playwright
 playwright install chromium
 
+# Pillow-SIMD（任意）: USE_PILLOW_SIMD=1 のときだけ標準Pillowを置き換える
+# resize/rotate/paste がSSE4/AVX2カーネルになる。AVX2非対応CPUでは CC="cc -msse4" を指定する
+# moviepy/imageio は "pillow" に依存するため、requirements.txt を再インストールすると標準Pillowに戻る点に注意
+if [ "${USE_PILLOW_SIMD:-0}" = "1" ]; then
+    echo "Pillow-SIMDをインストールします（libjpeg/zlibの開発ヘッダが必要）..."
+    pip uninstall -y pillow pillow-simd
+    CC="${PILLOW_SIMD_CC:-cc -mavx2}" pip install --no-cache-dir --force-reinstall pillow-simd
+    if python -c "import PIL, sys; sys.exit(0 if '.post' in PIL.__version__ else 1)"; then
+        echo "✅ Pillow-SIMD $(python -c 'import PIL; print(PIL.__version__)') が有効です"
+    else
+        echo "❌ Pillow-SIMDのインストールに失敗しました。標準Pillowを再インストールします"
+        pip install "$(grep -i '^pillow==' requirements.txt | cut -d' ' -f1)"
+    fi
+fi
+
 echo "✅ Python依存関係のインストール完了"
 
 # 2. ImageMagickの確認